@@ -0,0 +1,67 @@
+import hashlib
+import os
+import re
+from compression import PrecompressedStaticFiles
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# Unfingerprinted and stale-hash URLs must be revalidated, since their content can change
+REVALIDATE_CACHE_CONTROL = "no-cache"
+FINGERPRINT_LENGTH = 12
+_FINGERPRINTED = re.compile(r"^(?P<stem>.+)\.(?P<digest>[0-9a-f]{%d})(?P<ext>\.[^./]+)$" % FINGERPRINT_LENGTH)
+# Build artifacts of build_static.py, served as encodings of their originals rather than as assets
+_SKIPPED_SUFFIXES = (".gz", ".br")
+
+def fingerprint(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as asset:
+        for chunk in iter(lambda: asset.read(65536), b""):
+            digest.update(chunk)
+    return digest.hexdigest()[:FINGERPRINT_LENGTH]
+
+def build_manifest(directory):
+    """Map every asset path under directory (relative, with /) to its content-hashed name."""
+    manifest = {}
+    if not os.path.isdir(directory):
+        return manifest
+    for root, _, files in os.walk(directory):
+        for name in files:
+            if name.endswith(_SKIPPED_SUFFIXES):
+                continue
+            full_path = os.path.join(root, name)
+            relative = os.path.relpath(full_path, directory).replace(os.sep, "/")
+            stem, ext = os.path.splitext(relative)
+            manifest[relative] = f"{stem}.{fingerprint(full_path)}{ext}"
+    return manifest
+
+class FingerprintedStaticFiles(PrecompressedStaticFiles):
+    """
+    Static files addressed by content hash. The manifest is built once at startup;
+    asset_url() hands templates the hashed URL, which is served with a one-year immutable
+    Cache-Control, so a deploy that changes a file simply changes its URL.
+    """
+
+    def __init__(self, *args, url_prefix="/static", **kwargs):
+        super().__init__(*args, **kwargs)
+        self.url_prefix = url_prefix.rstrip("/")
+        self.manifest = build_manifest(self.directory) if self.directory else {}
+        self.originals = {hashed: original for original, hashed in self.manifest.items()}
+
+    def asset_url(self, path):
+        return f"{self.url_prefix}/{self.manifest.get(path, path)}"
+
+    async def get_response(self, path, scope):
+        path = path.replace(os.sep, "/")
+        original = self.originals.get(path)
+        if original is not None:
+            response = await super().get_response(original, scope)
+            cache_control = IMMUTABLE_CACHE_CONTROL
+        else:
+            # A hash from an older deploy still resolves to the current file, just without the long cache
+            match = _FINGERPRINTED.match(path)
+            if match and match.group("stem") + match.group("ext") in self.manifest:
+                path = match.group("stem") + match.group("ext")
+            response = await super().get_response(path, scope)
+            cache_control = REVALIDATE_CACHE_CONTROL
+        if response.status_code in (200, 304):
+            response.headers["Cache-Control"] = cache_control
+        return response
@@ -0,0 +1,125 @@
+"""
+Concurrency benchmark for the database-backed routes.
+
+Fires batches of concurrent requests at the app in-process and reports throughput and
+latency per concurrency level. --latency-ms adds a sleep before every SQL statement to
+stand in for the network round trip to a hosted database; with the handlers off the
+event loop, throughput should grow with concurrency until DB_THREADS or the connection
+pool is saturated. --writers keeps that many clients posting reviews during every level,
+to check that searches keep their throughput while reviews are written; it writes to the
+configured database, so point DATABASE_URL at a scratch copy.
+
+    python benchmarks/concurrency.py --path "/api/colleges?limit=20" --latency-ms 5
+    python benchmarks/concurrency.py --path "/api/results?score=5000" --latency-ms 0 --writers 4
+"""
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import time
+
+import httpx
+from sqlalchemy import event
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main
+from database import engine, read_engine, pool_stats
+
+def add_query_latency(seconds):
+    def _sleep(conn, cursor, statement, parameters, context, executemany):
+        time.sleep(seconds)
+    for target in {engine, read_engine}:
+        event.listen(target, "before_cursor_execute", _sleep)
+
+async def run_level(client, path, concurrency, requests_per_worker, writers=0, college_name=None):
+    latencies = []
+    writes = []
+    done = asyncio.Event()
+
+    async def writer():
+        while not done.is_set():
+            started = time.perf_counter()
+            response = await client.post(
+                "/api/submit_review",
+                data={"college_name": college_name, "review_text": "benchmark", "rating": "4"}
+            )
+            writes.append(time.perf_counter() - started)
+            # submit_review reports failures as a 200 with an "error" body
+            response.raise_for_status()
+            if "message" not in response.json():
+                raise RuntimeError(f"review write failed: {response.json()}")
+
+    async def worker():
+        for _ in range(requests_per_worker):
+            started = time.perf_counter()
+            response = await client.get(path)
+            latencies.append(time.perf_counter() - started)
+            response.raise_for_status()
+
+    async def readers():
+        try:
+            await asyncio.gather(*(worker() for _ in range(concurrency)))
+        finally:
+            done.set()
+
+    started = time.perf_counter()
+    await asyncio.gather(readers(), *(writer() for _ in range(writers)))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "writes": len(writes),
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "throughput": len(latencies) / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+    }
+
+def print_pool_stats(label, stats):
+    print(
+        f"{label}: size={stats['size']} overflow={stats['max_overflow']} max_in_use={stats['max_in_use']} "
+        f"timeouts={stats['timeouts']} checkout p95={stats['wait_ms']['p95']:.2f}ms max={stats['wait_ms']['max']:.2f}ms"
+    )
+
+async def run(args):
+    await main.startup_event()
+    if args.latency_ms:
+        add_query_latency(args.latency_ms / 1000)
+    transport = httpx.ASGITransport(app=main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+        await client.get(args.path)  # warm up
+        college_name = main.app.state.catalog.names[0] if args.writers else None
+        print(
+            f"{args.path}  latency/query={args.latency_ms}ms  writers={args.writers}  "
+            f"DB_THREADS={main.DB_THREADS}  read engine={read_engine is not engine}"
+        )
+        print(f"{'concurrency':>11} {'requests':>8} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'writes':>7}")
+        baseline = None
+        for concurrency in args.levels:
+            result = await run_level(client, args.path, concurrency, args.requests, args.writers, college_name)
+            baseline = baseline or result["throughput"]
+            print(
+                f"{result['concurrency']:>11} {result['requests']:>8} {result['throughput']:>9.1f} "
+                f"{result['p50_ms']:>8.1f} {result['p95_ms']:>8.1f} {result['writes']:>7}  "
+                f"x{result['throughput'] / baseline:.1f}"
+            )
+        stats = pool_stats()
+        if stats:
+            # Reads go through the read engine's pool when it is separate, so report both
+            print_pool_stats("write pool" if "read" in stats else "pool", stats)
+            if stats.get("read"):
+                print_pool_stats("read pool", stats["read"])
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--path", default="/api/colleges?limit=20")
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    parser.add_argument("--requests", type=int, default=20, help="requests per concurrent client")
+    parser.add_argument("--writers", type=int, default=0, help="concurrent review writers per level")
+    parser.add_argument("--levels", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32])
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+    asyncio.run(run(args))
@@ -0,0 +1,251 @@
+"""
+Microbenchmarks for the main.py helpers on the hot and startup paths.
+
+Builds synthetic SQLite catalogs (1k, 100k and 1M colleges by default, each with
+several average review counts per college) and reports, per helper, the best
+wall time over --repeat runs and the peak traced allocation of one extra run
+under tracemalloc. Helpers that modify the database (normalize_case,
+clean_duplicates) run against a fresh copy of the catalog every time.
+
+    python benchmarks/helpers.py --sizes 1000 100000 --json before.json
+    python benchmarks/helpers.py --sizes 1000 100000 --compare before.json
+
+With --compare, the script exits non-zero when any helper is slower than
+--threshold times its baseline, so it can gate a deploy.
+"""
+import argparse
+import gc
+import json
+import logging
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main
+from database import Base, apply_sqlite_pragmas
+from models import College, Review, NORMALIZED_COLUMNS, normalize_text
+from review_stats import rebuild_review_stats
+
+SIZES = (1_000, 100_000, 1_000_000)
+REVIEW_MEANS = (0.0, 3.0)
+INSERT_BATCH_SIZE = 10_000
+# Share of rows inserted without their normalized columns (backfilled by normalize_case)
+STALE_FRACTION = 0.1
+# Share of rows duplicated with a NULL branch, which unique_college lets through (removed by clean_duplicates)
+DUPLICATE_FRACTION = 0.01
+
+STATES = ["Odisha", "Karnataka", "Maharashtra", "Tamil Nadu", "Kerala", "Gujarat", "Punjab", "Bihar"]
+LOCATIONS = [f"District {number}" for number in range(60)]
+COURSE_LEVELS = ["BTech", "Diploma", "Degree"]
+BRANCHES = [
+    "Mechanical Engineering", "Computer Science", "Civil Engineering",
+    "Electronics And Telecommunication", "Electrical Engineering",
+]
+SEARCH_FILTERS = {"course_level": "BTech", "state": "odisha", "score": 5000.0}
+
+def _batches(rows, size=INSERT_BATCH_SIZE):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+def _college_rows(size, rng):
+    duplicates = int(size * DUPLICATE_FRACTION)
+    for number in range(size):
+        cutoff_min = rng.uniform(100, 60000)
+        row = {
+            "name": f"Synthetic College {number}",
+            "state": rng.choice(STATES),
+            "location": rng.choice(LOCATIONS),
+            "course_level": rng.choice(COURSE_LEVELS),
+            "branch": None if number < duplicates else rng.choice(BRANCHES),
+            "fees": float(rng.randrange(20000, 400000, 1000)),
+            "cutoff_min": cutoff_min,
+            "cutoff_max": cutoff_min + rng.uniform(100, 40000),
+        }
+        stale = rng.random() < STALE_FRACTION
+        for column, shadow in NORMALIZED_COLUMNS.items():
+            row[shadow] = None if stale else normalize_text(row[column])
+        yield row
+        if number < duplicates:
+            yield dict(row)
+
+def _review_rows(college_ids, mean, rng):
+    # Exponentially distributed counts: most colleges have a few reviews, a handful have many
+    created_at = datetime(2024, 1, 1)
+    for college_id, name in college_ids:
+        for _ in range(int(rng.expovariate(1 / mean)) if mean else 0):
+            yield {
+                "college_id": college_id,
+                "college_name": name,
+                "review_text": "Synthetic review",
+                "rating": float(rng.randint(1, 5)),
+                "created_at": created_at,
+            }
+
+def build_catalog(path, size, review_mean, seed=0):
+    """Write a synthetic catalog to a new SQLite file at path; returns (colleges, reviews)."""
+    rng = random.Random(seed)
+    engine = create_engine(f"sqlite:///{path}")
+    apply_sqlite_pragmas(engine)
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as connection:
+        for batch in _batches(_college_rows(size, rng)):
+            connection.execute(insert(College.__table__), batch)
+        college_ids = connection.execute(College.__table__.select().with_only_columns(College.id, College.name)).all()
+        reviews = 0
+        for batch in _batches(_review_rows(college_ids, review_mean, rng)):
+            connection.execute(insert(Review.__table__), batch)
+            reviews += len(batch)
+    db = sessionmaker(bind=engine)()
+    try:
+        rebuild_review_stats(db)
+    finally:
+        db.close()
+    engine.dispose()
+    return len(college_ids), reviews
+
+def measure(run, repeat, setup=None):
+    """
+    Best wall time of `repeat` runs, then peak traced allocation of one more run.
+    setup() is called untimed before every run and its result passed to run().
+    """
+    timings = []
+    for _ in range(repeat):
+        argument = setup() if setup else None
+        gc.collect()
+        started = time.perf_counter()
+        run(argument)
+        timings.append(time.perf_counter() - started)
+    argument = setup() if setup else None
+    gc.collect()
+    tracemalloc.start()
+    try:
+        run(argument)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return min(timings), peak
+
+def bench_catalog(path, repeat):
+    """Run every helper against the catalog at path and return {helper: (seconds, peak_bytes)}."""
+    workdir = os.path.dirname(path)
+    engines = []
+
+    def session_for(database_path):
+        engine = create_engine(f"sqlite:///{database_path}")
+        apply_sqlite_pragmas(engine)
+        engines.append(engine)
+        return sessionmaker(bind=engine)()
+
+    def fresh_copy():
+        # Mutating helpers get their own copy so every run sees the same starting data
+        for engine in engines[1:]:
+            engine.dispose()
+        del engines[1:]
+        copy = os.path.join(workdir, "scratch.db")
+        for suffix in ("-wal", "-shm"):
+            if os.path.exists(copy + suffix):
+                os.remove(copy + suffix)
+        shutil.copyfile(path, copy)
+        return session_for(copy)
+
+    db = session_for(path)
+    results = {}
+    try:
+        results["get_deduplicated_colleges"] = measure(
+            lambda _: main.get_deduplicated_colleges(db.query(College), db), repeat)
+        colleges = main.get_deduplicated_colleges(db.query(College), db)
+        results["format_college_results"] = measure(
+            lambda _: main.format_college_results(colleges, db), repeat)
+        del colleges
+        results["build_search_query"] = measure(
+            lambda _: main.deduplicated_query(main.build_search_query(db, **SEARCH_FILTERS)).all(), repeat)
+        results["update_suggestions"] = measure(lambda _: main.update_suggestions(db), repeat)
+        db.expunge_all()
+
+        def run_and_close(helper):
+            def run(scratch):
+                try:
+                    helper(scratch)
+                finally:
+                    scratch.close()
+            return run
+
+        results["normalize_case"] = measure(run_and_close(main.normalize_case), repeat, setup=fresh_copy)
+        results["clean_duplicates"] = measure(run_and_close(main.clean_duplicates), repeat, setup=fresh_copy)
+    finally:
+        db.close()
+        for engine in engines:
+            engine.dispose()
+    return results
+
+def compare(results, baseline, threshold, min_delta=0.005):
+    """
+    Return the (key, seconds, baseline_seconds) entries slower than threshold x baseline.
+    Differences below min_delta seconds are timer noise on the small catalogs and are ignored.
+    """
+    slower = []
+    for key, entry in results.items():
+        previous = baseline.get(key)
+        if not previous or entry["seconds"] - previous["seconds"] < min_delta:
+            continue
+        if entry["seconds"] > previous["seconds"] * threshold:
+            slower.append((key, entry["seconds"], previous["seconds"]))
+    return slower
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES))
+    parser.add_argument("--reviews", type=float, nargs="+", default=list(REVIEW_MEANS),
+                        help="average reviews per college")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="write results to this file")
+    parser.add_argument("--compare", help="baseline results file written by --json")
+    parser.add_argument("--threshold", type=float, default=1.25)
+    parser.add_argument("--min-delta-ms", type=float, default=5.0,
+                        help="ignore slowdowns smaller than this when comparing")
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    results = {}
+    print(f"{'colleges':>9} {'reviews':>9} {'helper':<27} {'best ms':>10} {'peak MiB':>9}")
+    for size in args.sizes:
+        for review_mean in args.reviews:
+            workdir = tempfile.mkdtemp(prefix="college-bench-")
+            try:
+                path = os.path.join(workdir, "catalog.db")
+                colleges, reviews = build_catalog(path, size, review_mean, args.seed)
+                for helper, (seconds, peak) in bench_catalog(path, args.repeat).items():
+                    key = f"{size}/{review_mean:g}/{helper}"
+                    results[key] = {"colleges": colleges, "reviews": reviews, "seconds": seconds, "peak_bytes": peak}
+                    print(f"{colleges:>9} {reviews:>9} {helper:<27} {seconds * 1000:>10.1f} {peak / 2 ** 20:>9.1f}")
+            finally:
+                shutil.rmtree(workdir, ignore_errors=True)
+
+    if args.json:
+        with open(args.json, "w") as output:
+            json.dump(results, output, indent=2, sort_keys=True)
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            slower = compare(results, json.load(baseline_file), args.threshold, args.min_delta_ms / 1000)
+        for key, seconds, previous in slower:
+            print(f"❌ {key}: {seconds * 1000:.1f} ms vs {previous * 1000:.1f} ms baseline")
+        if slower:
+            sys.exit(1)
+        print(f"✅ No helper slower than {args.threshold:g}x its baseline")
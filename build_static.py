@@ -0,0 +1,46 @@
+"""
+Write precompressed .gz (and, with the brotli package, .br) siblings for every
+compressible file under static/, served by compression.PrecompressedStaticFiles.
+Run at build time:
+
+    python build_static.py
+"""
+import gzip
+import os
+import sys
+from compression import brotli
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+COMPRESSIBLE_EXTENSIONS = {".css", ".js", ".mjs", ".json", ".svg", ".html", ".txt", ".xml", ".map", ".ico"}
+
+def _write_if_smaller(path, original, compressed):
+    # Variants that do not save anything are removed, so the server falls back to the original
+    if len(compressed) < len(original):
+        with open(path, "wb") as output:
+            output.write(compressed)
+        return True
+    if os.path.exists(path):
+        os.remove(path)
+    return False
+
+def precompress(directory=STATIC_DIR):
+    written = 0
+    for root, _, files in os.walk(directory):
+        for name in files:
+            if os.path.splitext(name)[1].lower() not in COMPRESSIBLE_EXTENSIONS:
+                continue
+            path = os.path.join(root, name)
+            with open(path, "rb") as source:
+                original = source.read()
+            # mtime=0 keeps the .gz bytes reproducible between builds
+            written += _write_if_smaller(path + ".gz", original, gzip.compress(original, compresslevel=9, mtime=0))
+            if brotli is not None:
+                written += _write_if_smaller(path + ".br", original, brotli.compress(original, quality=11))
+    return written
+
+if __name__ == "__main__":
+    if not os.path.isdir(STATIC_DIR):
+        print(f"❌ No static directory at {STATIC_DIR}")
+        sys.exit(1)
+    written = precompress()
+    print(f"✅ Wrote {written} precompressed static files{'' if brotli is not None else ' (gzip only; brotli not installed)'}")
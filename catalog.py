@@ -0,0 +1,154 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import islice
+from collections import namedtuple
+from models import College, normalize_text
+from interval_index import IntervalIndex
+
+# Lightweight stand-in for a College row; exposes the same attributes the formatters read
+CollegeRow = namedtuple(
+    "CollegeRow",
+    ["id", "name", "state", "location", "course_level", "branch", "fees", "cutoff_min", "cutoff_max"]
+)
+
+def _equal(positions, column, value):
+    # A generator function, so each filter keeps its own column and value
+    return (position for position in positions if column[position] == value)
+
+class CatalogSnapshot:
+    """
+    Immutable, process-local copy of the colleges table held as column arrays.
+    Rows must arrive deduplicated and in id order, as load() returns them.
+    The database stays the source of truth: callers build a new snapshot after writes and swap it in.
+    """
+
+    def __init__(self, rows):
+        self.ids = array("q")
+        self.names = []
+        self.states = []
+        self.locations = []
+        self.course_levels = []
+        self.branches = []
+        self.fees = array("d")
+        self.cutoff_min = array("d")
+        self.cutoff_max = array("d")
+        # Normalized equality postings: field -> normalize_text(value) -> row positions
+        self.postings = {"course_level": {}, "state": {}, "location": {}, "name": {}, "branch": {}}
+        # normalize_text(value) per row for the text fields, so filters not used to pick the
+        # candidate rows are checked per position; repeated values share one string
+        self.normalized = {"state": [], "location": [], "name": [], "branch": []}
+        normalized_values = {}
+
+        for row in rows:
+            position = len(self.ids)
+            self.ids.append(row.id)
+            self.names.append(row.name)
+            self.states.append(row.state)
+            self.locations.append(row.location)
+            self.course_levels.append(row.course_level)
+            self.branches.append(row.branch)
+            self.fees.append(row.fees if row.fees is not None else float("nan"))
+            self.cutoff_min.append(row.cutoff_min if row.cutoff_min is not None else float("nan"))
+            self.cutoff_max.append(row.cutoff_max if row.cutoff_max is not None else float("nan"))
+            self.postings["course_level"].setdefault(row.course_level, []).append(position)
+            for field, value in (("state", row.state), ("location", row.location), ("name", row.name), ("branch", row.branch)):
+                if value not in normalized_values:
+                    normalized_values[value] = normalize_text(value)
+                key = normalized_values[value]
+                self.normalized[field].append(key)
+                self.postings[field].setdefault(key, []).append(position)
+        self.cutoffs = IntervalIndex(zip(self.cutoff_min, self.cutoff_max, range(len(self.ids))))
+
+    @classmethod
+    def load(cls, db, query):
+        # query is a deduplicated College query in id order (see main.deduplicated_query)
+        rows = query.with_entities(
+            College.id, College.name, College.state, College.location, College.course_level,
+            College.branch, College.fees, College.cutoff_min, College.cutoff_max
+        )
+        return cls(CollegeRow(*row) for row in rows)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def score_key(self, score):
+        # Scores with equal keys match exactly the same rows
+        return self.cutoffs.equivalence_key(score)
+
+    def row(self, position):
+        fees = self.fees[position]
+        cutoff_min = self.cutoff_min[position]
+        cutoff_max = self.cutoff_max[position]
+        return CollegeRow(
+            self.ids[position],
+            self.names[position],
+            self.states[position],
+            self.locations[position],
+            self.course_levels[position],
+            self.branches[position],
+            None if fees != fees else fees,
+            None if cutoff_min != cutoff_min else cutoff_min,
+            None if cutoff_max != cutoff_max else cutoff_max,
+        )
+
+    def search(self, course_level=None, state="", location="", college_name="", branch="",
+               fees_range=None, max_fees=None, score=None, after_id=None, limit=None):
+        """
+        Mirror of build_search_query: course_level matches exactly, the text fields match
+        on their normalize_text form, fees_range is an inclusive (low, high) pair and score must lie
+        within [cutoff_min, cutoff_max]. Returns CollegeRow objects in id order, starting
+        after after_id and stopping at limit rows when given.
+        """
+        if score is not None and score != score:
+            return []
+        # (column, value, posting list) per equality filter
+        equalities = []
+        if course_level is not None:
+            equalities.append((self.course_levels, course_level, self.postings["course_level"].get(course_level, [])))
+        for field, value in (("state", state), ("location", location), ("name", college_name), ("branch", branch)):
+            if value:
+                key = normalize_text(value)
+                equalities.append((self.normalized[field], key, self.postings[field].get(key, [])))
+
+        # Walk the cheapest candidate set in id order and check every other filter per position,
+        # instead of materialising and intersecting the larger sets. Without a limit a walk costs
+        # its length; with one it stops after about limit * len(self) / matching positions, so a
+        # page of a broad score filter never collects and sorts the whole match set.
+        first = bisect_right(self.ids, after_id) if after_id is not None else 0
+        matching = self.cutoffs.count(score) if score is not None else len(self.ids)
+
+        def walk_cost(positions):
+            remaining = len(positions) - bisect_left(positions, first)
+            if limit is None:
+                return remaining
+            return min(remaining, limit * len(self.ids) / max(matching, 1))
+
+        candidates = [equality[2] for equality in equalities] or [range(len(self.ids))]
+        driver = min(range(len(candidates)), key=lambda index: walk_cost(candidates[index]))
+        check_score = score is not None
+        if check_score and matching < walk_cost(candidates[driver]):
+            positions = sorted(self.cutoffs.stab(score))
+            check_score = False
+        else:
+            positions = candidates[driver]
+            if equalities:
+                del equalities[driver]
+        if first:
+            # ids ascend with position, so the keyset bound is a bisect on each array
+            positions = positions[bisect_left(positions, first):]
+
+        # Lazy filters, so a limit stops the walk as soon as enough rows are found
+        for column, value, _ in equalities:
+            positions = _equal(positions, column, value)
+        if check_score:
+            cutoff_min, cutoff_max = self.cutoff_min, self.cutoff_max
+            positions = (position for position in positions if cutoff_min[position] <= score <= cutoff_max[position])
+        fees = self.fees
+        if fees_range is not None:
+            low, high = fees_range
+            positions = (position for position in positions if low <= fees[position] <= high)
+        if max_fees is not None:
+            positions = (position for position in positions if fees[position] <= max_fees)
+        if limit is not None:
+            positions = islice(positions, limit)
+        return [self.row(position) for position in positions]
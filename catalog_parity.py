@@ -0,0 +1,112 @@
+"""
+Parity check between the in-memory catalog snapshot and the SQL search it mirrors.
+
+Loads a small synthetic catalog (with duplicates, NULL cutoffs and NULL fees) into a fresh
+SQLite database, then runs every case through CatalogSnapshot.search and through
+deduplicated_query(build_search_query(...)) and fails when the returned ids differ.
+Cases cover unfiltered listings, scores on and just outside cutoff boundaries, NaN and
+infinite scores, fee filters and keyset pages.
+
+    python catalog_parity.py
+"""
+from itertools import product
+import logging
+import random
+import sys
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from database import Base
+from catalog import CatalogSnapshot
+from main import build_search_query, deduplicated_query
+from models import College, NORMALIZED_COLUMNS, normalize_text
+from pagination import paginate_query
+
+STATES = ["Odisha", "Karnataka", "Kerala"]
+LOCATIONS = ["Cuttack", "Puri", "Mysore"]
+COURSE_LEVELS = ["BTech", "Diploma"]
+BRANCHES = ["Computer Science", "Civil Engineering", None]
+
+def build_rows(count=400, seed=0):
+    rng = random.Random(seed)
+    rows = []
+    for number in range(count):
+        cutoff_min = float(rng.randrange(100, 50000, 100))
+        row = {
+            "name": f"College {number}",
+            "state": rng.choice(STATES),
+            "location": rng.choice(LOCATIONS),
+            "course_level": rng.choice(COURSE_LEVELS),
+            "branch": rng.choice(BRANCHES),
+            "fees": None if number % 37 == 0 else float(rng.randrange(20000, 300000, 10000)),
+            "cutoff_min": None if number % 41 == 0 else cutoff_min,
+            "cutoff_max": None if number % 43 == 0 else cutoff_min + rng.randrange(0, 20000, 100),
+        }
+        for column, shadow in NORMALIZED_COLUMNS.items():
+            row[shadow] = normalize_text(row[column])
+        rows.append(row)
+    # NULL-branch duplicates are not rejected by unique_college, so both copies reach the table
+    rows += [dict(row) for row in rows[:20] if row["branch"] is None]
+    return rows
+
+def score_cases(rows):
+    cutoffs = sorted({row[key] for row in rows for key in ("cutoff_min", "cutoff_max") if row[key] is not None})
+    scores = [None, float("nan"), float("inf"), float("-inf"), 0.0, 1e9]
+    for cutoff in cutoffs[:: max(1, len(cutoffs) // 12)]:
+        scores += [cutoff, cutoff - 0.5, cutoff + 0.5]
+    return scores
+
+def search_cases(rows):
+    filters = [
+        {},
+        {"course_level": "BTech"},
+        {"course_level": "Diploma", "state": "odisha"},
+        {"course_level": "BTech", "location": " PURI ", "branch": "computer science"},
+        {"college_name": "college 7"},
+        {"course_level": "BTech", "fees_range": (100000.0, 200000.0)},
+        {"max_fees": 150000.0},
+    ]
+    pages = [(None, None), (None, 5), (60, 5), (200, 500)]
+    for base, score, (after_id, limit) in product(filters, score_cases(rows), pages):
+        case = dict(base)
+        if score is not None:
+            case["score"] = score
+        yield case, after_id, limit
+
+def check_catalog_parity():
+    """Return (filters, after_id, limit, snapshot ids, SQL ids) for every case that disagrees."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    failures = []
+    try:
+        rows = build_rows()
+        db.execute(College.__table__.insert(), rows)
+        db.commit()
+        snapshot = CatalogSnapshot.load(db, deduplicated_query(db.query(College)))
+        for filters, after_id, limit in search_cases(rows):
+            query = deduplicated_query(build_search_query(db, **filters))
+            # Paged calls ask the snapshot for the same look-ahead row paginate_query adds
+            if limit is not None or after_id is not None:
+                query = paginate_query(query, after_id, limit)
+            expected = [college.id for college in query]
+            found = [
+                row.id for row in
+                snapshot.search(after_id=after_id, limit=limit + 1 if limit is not None else None, **filters)
+            ]
+            if found != expected:
+                failures.append((filters, after_id, limit, found, expected))
+    finally:
+        db.close()
+        engine.dispose()
+    return failures
+
+if __name__ == "__main__":
+    logging.disable(logging.INFO)
+    failures = check_catalog_parity()
+    for filters, after_id, limit, found, expected in failures:
+        print(f"❌ {filters} after_id={after_id} limit={limit}: snapshot {len(found)} rows, SQL {len(expected)} rows")
+    if failures:
+        sys.exit(1)
+    print("✅ Catalog snapshot matches SQL for every search case")
@@ -0,0 +1,199 @@
+import gzip
+import os
+from mimetypes import guess_type
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import FileResponse
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from cache import LRUCache
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip is always available
+    brotli = None
+
+# Responses smaller than this are sent as-is; compression would not pay for the header overhead
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+GZIP_LEVEL = int(os.getenv("GZIP_LEVEL", "6"))
+BROTLI_QUALITY = int(os.getenv("BROTLI_QUALITY", "5"))
+# Compressed bodies of responses with an ETag, keyed by (path, ETag, encoding); FileResponse
+# ETags only hash mtime and size, so the ETag alone does not identify the content
+COMPRESSION_CACHE_SIZE = int(os.getenv("COMPRESSION_CACHE_SIZE", "128"))
+
+COMPRESSIBLE_TYPES = (
+    "text/", "application/json", "application/x-ndjson", "application/javascript",
+    "application/xml", "image/svg+xml",
+)
+ENCODING_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+def accepted_encodings(header):
+    """Parse Accept-Encoding into {encoding: q}, dropping anything refused with q=0."""
+    encodings = {}
+    for part in (header or "").split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if name and quality > 0:
+            encodings[name.strip().lower()] = quality
+    return encodings
+
+def choose_encoding(header, available=None):
+    # Prefer brotli on equal q; without the brotli package only gzip can be produced on the fly
+    if available is None:
+        available = ("br", "gzip") if brotli is not None else ("gzip",)
+    encodings = accepted_encodings(header)
+    candidates = [name for name in ("br", "gzip") if name in encodings and name in available]
+    if not candidates:
+        return None
+    return max(candidates, key=lambda name: encodings[name])
+
+def compress(body, encoding):
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL)
+
+def encoded_etag(etag, encoding):
+    # A compressed body is a different representation, so it needs its own strong validator
+    return etag[:-1] + f'-{encoding}"' if etag.endswith('"') else etag
+
+def strip_encoding_suffixes(if_none_match):
+    """Turn `"tag-gzip"` back into `"tag"` so handlers compare against their own ETags."""
+    tags, suffix = [], None
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        for encoding in ENCODING_SUFFIXES:
+            marker = f'-{encoding}"'
+            if tag.endswith(marker):
+                tag, suffix = tag[:-len(marker)] + '"', encoding
+                break
+        tags.append(tag)
+    return ", ".join(tags), suffix
+
+def varies_on_encoding(headers):
+    return "accept-encoding" in (part.strip().lower() for part in headers.get("vary", "").split(","))
+
+class CompressionMiddleware:
+    """
+    Negotiated gzip/brotli compression for single-chunk responses of compressible types
+    above COMPRESSION_MIN_SIZE. Streaming and already-encoded responses pass through.
+    ETags get an -gzip/-br suffix, and the suffix is stripped from If-None-Match on the
+    way in so handlers can still answer revalidations with 304.
+    """
+
+    def __init__(self, app, minimum_size=COMPRESSION_MIN_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.cache = LRUCache(maxsize=COMPRESSION_CACHE_SIZE)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+        encoding = choose_encoding(request_headers.get("accept-encoding"))
+        revalidated_as = None
+        if "if-none-match" in request_headers:
+            raw = [(key, value) for key, value in scope["headers"] if key != b"if-none-match"]
+            if_none_match, revalidated_as = strip_encoding_suffixes(request_headers["if-none-match"])
+            raw.append((b"if-none-match", if_none_match.encode("latin-1")))
+            scope = dict(scope, headers=raw)
+
+        start_message = None
+
+        async def send_compressed(message):
+            nonlocal start_message
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+            if message["type"] != "http.response.body" or start_message is None:
+                await send(message)
+                return
+
+            start, start_message = start_message, None
+            headers = MutableHeaders(raw=list(start["headers"]))
+            body = message.get("body", b"")
+            if start["status"] == 304:
+                if revalidated_as and "etag" in headers:
+                    headers["ETag"] = encoded_etag(headers["etag"], revalidated_as)
+                await send(dict(start, headers=headers.raw))
+                await send(message)
+                return
+
+            eligible = (
+                encoding is not None
+                and not message.get("more_body", False)
+                and len(body) >= self.minimum_size
+                and "content-encoding" not in headers
+                and headers.get("content-type", "").startswith(COMPRESSIBLE_TYPES)
+            )
+            if headers.get("content-type", "").startswith(COMPRESSIBLE_TYPES) and not varies_on_encoding(headers):
+                headers.add_vary_header("Accept-Encoding")
+            if not eligible:
+                await send(dict(start, headers=headers.raw))
+                await send(message)
+                return
+
+            etag = headers.get("etag")
+            cache_key = (scope["path"], etag, encoding)
+            compressed = self.cache.get(cache_key) if etag else None
+            if compressed is None:
+                compressed = compress(body, encoding)
+                if etag:
+                    self.cache.set(cache_key, compressed)
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(compressed))
+            if etag:
+                headers["ETag"] = encoded_etag(etag, encoding)
+            await send(dict(start, headers=headers.raw))
+            await send(dict(message, body=compressed))
+
+        await self.app(scope, receive, send_compressed)
+
+class PrecompressedStaticFiles(StaticFiles):
+    """
+    StaticFiles that serves the .br/.gz siblings written by build_static.py when the client
+    accepts them, so static assets cost no compression CPU per request.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # full path -> {encoding: (path, stat)}; the build step runs before the app starts
+        self._variants = {}
+
+    def _find_variants(self, full_path):
+        if full_path not in self._variants:
+            variants = {}
+            for encoding, suffix in ENCODING_SUFFIXES.items():
+                try:
+                    variants[encoding] = (full_path + suffix, os.stat(full_path + suffix))
+                except OSError:
+                    pass
+            self._variants[full_path] = variants
+        return self._variants[full_path]
+
+    def file_response(self, full_path, stat_result, scope, status_code=200):
+        full_path = str(full_path)
+        variants = self._find_variants(full_path)
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding"), variants) if variants else None
+        if encoding not in variants:
+            response = super().file_response(full_path, stat_result, scope, status_code)
+            if variants:
+                response.headers.add_vary_header("Accept-Encoding")
+            return response
+
+        variant_path, variant_stat = variants[encoding]
+        response = FileResponse(
+            variant_path,
+            status_code=status_code,
+            stat_result=variant_stat,
+            media_type=guess_type(full_path)[0] or "application/octet-stream",
+            headers={"Content-Encoding": encoding, "Vary": "Accept-Encoding"},
+        )
+        if self.is_not_modified(response.headers, Headers(scope=scope)):
+            return NotModifiedResponse(response.headers)
+        return response
@@ -0,0 +1,76 @@
+from models import AppMetadata
+from sqlalchemy import Integer, String, cast, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+import secrets
+
+# Both counters live in app_metadata so every worker process sees them.
+# data_version changes on any write visible through the API (colleges or reviews);
+# catalog_version only when the colleges themselves change.
+DATA_VERSION_KEY = "data_version"
+CATALOG_VERSION_KEY = "catalog_version"
+# Random token written once per database, so validators issued for a recreated database,
+# whose counters start over, never match the old ones
+DATA_EPOCH_KEY = "data_epoch"
+
+def read_data_versions(db):
+    """Return (data_version, catalog_version) with one primary-key lookup."""
+    values = dict(
+        db.query(AppMetadata.key, AppMetadata.value)
+        .filter(AppMetadata.key.in_((DATA_VERSION_KEY, CATALOG_VERSION_KEY)))
+    )
+    return int(values.get(DATA_VERSION_KEY) or 0), int(values.get(CATALOG_VERSION_KEY) or 0)
+
+def _insert_statement(dialect_name):
+    # INSERT that supports ON CONFLICT; None on dialects without it
+    if dialect_name == "sqlite":
+        return sqlite.insert(AppMetadata)
+    if dialect_name == "postgresql":
+        return postgresql.insert(AppMetadata)
+    return None
+
+def read_data_epoch(db):
+    """Return this database's epoch token, creating it on first use. Commits."""
+    epoch = db.query(AppMetadata.value).filter(AppMetadata.key == DATA_EPOCH_KEY).scalar()
+    if epoch is None:
+        token = secrets.token_hex(8)
+        statement = _insert_statement(db.get_bind().dialect.name)
+        try:
+            if statement is not None:
+                # Another worker may create it first; its token wins
+                db.execute(statement.values(key=DATA_EPOCH_KEY, value=token).on_conflict_do_nothing(index_elements=["key"]))
+            else:
+                db.add(AppMetadata(key=DATA_EPOCH_KEY, value=token))
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+        epoch = db.query(AppMetadata.value).filter(AppMetadata.key == DATA_EPOCH_KEY).scalar()
+    return epoch
+
+def _increment(db, key):
+    # One upsert, so the first writes of two workers cannot both insert the counter row
+    statement = _insert_statement(db.get_bind().dialect.name)
+    if statement is not None:
+        db.execute(
+            statement.values(key=key, value="1").on_conflict_do_update(
+                index_elements=["key"],
+                set_={"value": cast(cast(AppMetadata.value, Integer) + 1, String)}
+            )
+        )
+        return
+    updated = db.execute(
+        update(AppMetadata)
+        .where(AppMetadata.key == key)
+        .values(value=cast(cast(AppMetadata.value, Integer) + 1, String))
+    )
+    if updated.rowcount == 0:
+        db.add(AppMetadata(key=key, value="1"))
+
+def bump_data_version(db, catalog=False):
+    """
+    Record a write. Pass catalog=True when colleges were added, changed or removed.
+    Runs inside the caller's transaction; the caller commits.
+    """
+    _increment(db, DATA_VERSION_KEY)
+    if catalog:
+        _increment(db, CATALOG_VERSION_KEY)
@@ -0,0 +1,48 @@
+from email.utils import formatdate, parsedate_to_datetime
+import hashlib
+import os
+
+def strong_etag(body):
+    # Quoted content hash; identical bytes always get the same validator
+    return '"' + hashlib.sha1(body).hexdigest() + '"'
+
+def source_fingerprint(directory, subdirectories=("templates",)):
+    """Hash of the Python sources and templates under directory, as a build id of last resort."""
+    digest = hashlib.sha1()
+    paths = [os.path.join(directory, name) for name in os.listdir(directory) if name.endswith(".py")]
+    for subdirectory in subdirectories:
+        root = os.path.join(directory, subdirectory)
+        if os.path.isdir(root):
+            paths += [os.path.join(root, name) for name in os.listdir(root)]
+    for path in sorted(paths):
+        if os.path.isfile(path):
+            with open(path, "rb") as source:
+                digest.update(path.encode() + b"\0" + source.read())
+    return digest.hexdigest()[:12]
+
+def version_etag(version, url, build_id="", data_epoch=""):
+    # Responses are a pure function of the code, the database, its data version and the
+    # request URL, so the validator can be computed before (and instead of) building the response
+    scope = f"{build_id}|{data_epoch}|{url}"
+    return f'"{version}-' + hashlib.sha1(scope.encode()).hexdigest()[:16] + '"'
+
+def http_date(timestamp):
+    return formatdate(timestamp, usegmt=True)
+
+def is_not_modified(request, etag, last_modified=None):
+    """
+    Evaluate the request's conditional headers against the current validators.
+    If-None-Match takes precedence over If-Modified-Since, as in RFC 9110.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+        # Weak comparison: a W/ prefix added by a proxy still matches
+        return "*" in candidates or etag in [candidate[2:] if candidate.startswith("W/") else candidate for candidate in candidates]
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            return int(last_modified) <= parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+    return False
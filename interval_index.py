@@ -0,0 +1,89 @@
+from bisect import bisect_left, bisect_right
+
+class _Node:
+    __slots__ = ("center", "starts", "by_start", "neg_ends", "by_end", "left", "right")
+
+    def __init__(self, center, intervals):
+        self.center = center
+        ordered = sorted(intervals, key=lambda interval: interval[0])
+        self.starts = [start for start, _, _ in ordered]
+        self.by_start = [value for _, _, value in ordered]
+        ordered = sorted(intervals, key=lambda interval: -interval[1])
+        self.neg_ends = [-end for _, end, _ in ordered]
+        self.by_end = [value for _, _, value in ordered]
+        self.left = None
+        self.right = None
+
+class IntervalIndex:
+    """
+    Centered interval tree over closed intervals [start, end].
+    stab(point) returns the values of every interval containing point in O(log n + k).
+    Intervals with a missing or NaN endpoint are never matched, like NULLs in SQL,
+    and a NaN point matches nothing, as `cutoff_min <= NaN` is false in SQL.
+    """
+
+    def __init__(self, intervals):
+        intervals = [
+            (start, end, value) for start, end, value in intervals
+            if start is not None and end is not None and start == start and end == end and start <= end
+        ]
+        self._size = len(intervals)
+        self._root = self._build(intervals)
+        self._starts = sorted(start for start, _, _ in intervals)
+        self._ends = sorted(end for _, end, _ in intervals)
+
+    def __len__(self):
+        return self._size
+
+    def _build(self, intervals):
+        if not intervals:
+            return None
+        # The median endpoint always lands inside at least one interval, so every node is non-empty
+        endpoints = sorted(point for start, end, _ in intervals for point in (start, end))
+        center = endpoints[len(endpoints) // 2]
+        left, here, right = [], [], []
+        for interval in intervals:
+            if interval[1] < center:
+                left.append(interval)
+            elif interval[0] > center:
+                right.append(interval)
+            else:
+                here.append(interval)
+        node = _Node(center, here)
+        node.left = self._build(left)
+        node.right = self._build(right)
+        return node
+
+    def equivalence_key(self, point):
+        """
+        Identify the elementary interval containing point. Two points share a key exactly
+        when no interval starts in (a, b] or ends in [a, b), i.e. when stab() returns the
+        same set for both. A NaN point, which matches nothing, gets the key None.
+        """
+        if point != point:
+            return None
+        return bisect_right(self._starts, point), bisect_left(self._ends, point)
+
+    def count(self, point):
+        """Number of intervals containing point, in O(log n) without collecting them."""
+        if point != point:
+            return 0
+        return bisect_right(self._starts, point) - bisect_left(self._ends, point)
+
+    def stab(self, point):
+        if point != point:
+            # NaN fails every comparison and would otherwise take the root's `else` branch
+            return []
+        matches = []
+        node = self._root
+        while node is not None:
+            if point < node.center:
+                matches.extend(node.by_start[:bisect_right(node.starts, point)])
+                node = node.left
+            elif point > node.center:
+                matches.extend(node.by_end[:bisect_right(node.neg_ends, -point)])
+                node = node.right
+            else:
+                matches.extend(node.by_start)
+                break
+        return matches
@@ -1,30 +1,100 @@
 from fastapi import FastAPI, Request, Form, HTTPException, Depends
-from fastapi.responses import HTMLResponse, Response
+from fastapi.responses import HTMLResponse, Response, StreamingResponse
 from fastapi.templating import Jinja2Templates
-from fastapi.staticfiles import StaticFiles
-from database import SessionLocal, engine, Base
-from models import College, Review
+from compression import CompressionMiddleware
+from assets import FingerprintedStaticFiles
+from database import SessionLocal, ReadSessionLocal, engine, Base, DB_POOL_SIZE, DB_MAX_OVERFLOW, pool_stats
+from models import College, Review, ReviewStats, NORMALIZED_COLUMNS, normalize_text
+from review_stats import record_review, rebuild_review_stats
+from migrations import migrate_database, ensure_unique_colleges
+from catalog import CatalogSnapshot, CollegeRow
+from pagination import page_bounds, paginate_query, finish_page, NEXT_CURSOR_HEADER
+from cache import LRUCache
+from suggestions import SuggestionIndex, SUGGESTION_COLUMNS
 from typing import Optional
-from sqlalchemy.orm import Session
-from sqlalchemy.sql import text
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy import select, update, delete, exists
+from sqlalchemy.sql.util import ClauseAdapter
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.sql import text, func
 import os
+import json
+import math
+from jinja2 import FileSystemBytecodeCache
+from markupsafe import Markup
+from anyio import to_thread
 from initial_data import initialize_database
 import logging
+import time
+from request_logging import RouteLogger
+from http_cache import strong_etag, version_etag, source_fingerprint, http_date, is_not_modified
+from data_version import read_data_versions, read_data_epoch, bump_data_version
+from threading import Lock
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
+# Hot routes log counts and timings through sampled, lazily formatted route loggers
+index_log = RouteLogger(logger, "GET /")
+search_page_log = RouteLogger(logger, "POST /")
+search_api_log = RouteLogger(logger, "POST /api/search")
+colleges_log = RouteLogger(logger, "GET /api/colleges")
+predict_log = RouteLogger(logger, "GET /predict_colleges/")
+results_log = RouteLogger(logger, "GET /api/results")
+suggestions_log = RouteLogger(logger, "suggestions")
 
 # Initialize FastAPI app
 app = FastAPI()
-app.state.suggestions = {"college_name": [], "location": [], "state": [], "branch": []}
+# gzip/brotli for dynamic responses; static files are precompressed by build_static.py
+app.add_middleware(CompressionMiddleware)
+app.state.suggestions = SuggestionIndex()
+app.state.catalog = None
+# /api/results responses keyed by the score's elementary cutoff interval
+app.state.results_cache = LRUCache(maxsize=int(os.getenv("RESULTS_CACHE_SIZE", "256")))
+app.state.cache_generation = 0
+# Rendered GET / pages keyed by (cache generation, URL); the URL ends up in the SEO tags
+app.state.page_cache = LRUCache(maxsize=int(os.getenv("PAGE_CACHE_SIZE", "32")))
+# Rendered POST / result blocks keyed by normalized search filters and data version
+app.state.fragment_cache = LRUCache(maxsize=int(os.getenv("FRAGMENT_CACHE_SIZE", "256")))
+app.state.data_changed_at = time.time()
+# Shared app_metadata counters this worker's caches and catalog were last synced to
+app.state.data_version = None
+app.state.catalog_version = None
+# Per-database token mixed into the API ETags; set at startup
+app.state.data_epoch = ""
+version_lock = Lock()
+# Held by the one request thread rebuilding this worker's catalog snapshot
+catalog_lock = Lock()
 
-# Mount static files if directory exists
+# JSON APIs may be reused for API_MAX_AGE seconds and served stale while revalidating after that
+API_MAX_AGE = int(os.getenv("API_MAX_AGE", "0"))
+API_STALE_WHILE_REVALIDATE = int(os.getenv("API_STALE_WHILE_REVALIDATE", "60"))
+API_CACHE_CONTROL = f"public, max-age={API_MAX_AGE}, stale-while-revalidate={API_STALE_WHILE_REVALIDATE}"
+# Part of every API ETag, so a deploy that changes a response's shape invalidates old validators
+BUILD_ID = os.getenv("BUILD_ID") or os.getenv("RENDER_GIT_COMMIT") or source_fingerprint(os.path.dirname(os.path.abspath(__file__)))
+
+# Routes that touch the database are plain `def` handlers: FastAPI runs them, and get_db,
+# on its worker thread pool so concurrent requests overlap their database waits instead
+# of blocking the event loop. The pool is capped to match the engine's connection pool
+# so extra requests queue for a thread, not a connection.
+DB_THREADS = int(os.getenv("DB_THREADS", str(DB_POOL_SIZE + DB_MAX_OVERFLOW)))
+
+# Mount static files if directory exists; assets are addressed by content hash
+static_files = None
 if os.path.exists("static"):
-    app.mount("/static", StaticFiles(directory="static"), name="static")
+    static_files = FingerprintedStaticFiles(directory="static")
+    app.mount("/static", static_files, name="static")
 
 # Initialize templates
 templates = Jinja2Templates(directory="templates")
+# Compiled templates are cached on disk, shared by every worker and kept across restarts
+JINJA_CACHE_DIR = os.getenv("JINJA_CACHE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".jinja_cache"))
+try:
+    os.makedirs(JINJA_CACHE_DIR, exist_ok=True)
+    templates.env.bytecode_cache = FileSystemBytecodeCache(JINJA_CACHE_DIR)
+except OSError as e:
+    logger.warning(f"⚠️ Template bytecode cache disabled: {e}")
+templates.env.globals["asset_url"] = static_files.asset_url if static_files else (lambda path: f"/static/{path}")
 
 # Database session dependency
 def get_db():
@@ -34,6 +104,14 @@ def get_db():
     finally:
         db.close()
 
+# Session for handlers that only read; on SQLite this is a separate query-only engine
+def get_read_db():
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
 # College name mappings to normalize user input
 COLLEGE_MAPPINGS = {
     "tech college": "Tech College",
@@ -44,22 +122,162 @@ COLLEGE_MAPPINGS = {
 }
 
 # Helper functions for deduplication and formatting
+# Columns that identify one college offering; rows sharing them are duplicates
+DEDUP_COLUMNS = (College.name, College.state, College.location, College.course_level, College.branch)
+
+def deduplicated_query(query):
+    """
+    Narrow a College query to the lowest-id row of each duplicate group among its matches,
+    in id order. Runs in SQL as an anti-join on the unique_college key:
+    ... AND NOT EXISTS (SELECT 1 FROM colleges earlier WHERE <same key> AND earlier.id < colleges.id
+    AND <same filters>), which keeps the query on its filter index instead of grouping the table.
+    """
+    earlier = College.__table__.alias("earlier")
+    criteria = [earlier.c.name == College.name, earlier.c.id < College.id]
+    criteria += [earlier.c[column.key].is_not_distinct_from(column) for column in DEDUP_COLUMNS[1:]]
+    if query.whereclause is not None:
+        criteria.append(ClauseAdapter(earlier).traverse(query.whereclause))
+    return query.filter(~exists().where(*criteria)).order_by(College.id)
+
 def get_deduplicated_colleges(query, db: Session):
-    colleges = query.all()
-    seen = set()
-    deduplicated = []
-    for college in colleges:
-        key = (college.name, college.state, college.location, college.course_level, getattr(college, 'branch', None))
-        if key not in seen:
-            seen.add(key)
-            deduplicated.append(college)
-    return deduplicated
+    return deduplicated_query(query).all()
+
+def build_search_query(db: Session, course_level=None, state="", location="", college_name="", branch="",
+                       fees_range=None, max_fees=None, score=None):
+    query = db.query(College)
+    if course_level is not None:
+        query = query.filter(College.course_level == course_level)
+    if state:
+        query = query.filter(College.state_norm == normalize_text(state))
+    if location:
+        query = query.filter(College.location_norm == normalize_text(location))
+    if college_name:
+        query = query.filter(College.name_norm == normalize_text(college_name))
+    if branch:
+        query = query.filter(College.branch_norm == normalize_text(branch))
+    if fees_range is not None:
+        query = query.filter(College.fees.between(*fees_range))
+    if max_fees is not None:
+        query = query.filter(College.fees <= max_fees)
+    if score is not None:
+        query = query.filter(College.cutoff_min <= score, College.cutoff_max >= score)
+    return query
+
+def search_colleges(db: Session, after_id=None, limit=None, **filters):
+    # Served from the in-memory snapshot when it is loaded; SQL remains the fallback.
+    # With a limit, one look-ahead row is returned for finish_page.
+    fetch_limit = limit + 1 if limit is not None else None
+    catalog = app.state.catalog
+    if catalog is not None:
+        return catalog.search(after_id=after_id, limit=fetch_limit, **filters)
+    query = deduplicated_query(build_search_query(db, **filters))
+    if limit is not None or after_id is not None:
+        query = paginate_query(query, after_id, limit)
+    return query.all()
 
-def format_college_results(colleges, db: Session):
+def refresh_catalog(db: Session):
+    # Versions are read first, so a write that lands during the load triggers another sync.
+    # The snapshot is built without any lock held; only the swap is done under version_lock.
+    data_version, catalog_version = read_data_versions(db)
+    catalog = CatalogSnapshot.load(db, deduplicated_query(db.query(College)))
+    with version_lock:
+        app.state.catalog = catalog
+        invalidate_read_caches()
+        app.state.data_version, app.state.catalog_version = data_version, catalog_version
+    logger.info(f"✅ Catalog snapshot loaded with {len(catalog)} colleges")
+
+def sync_data_version(db: Session):
+    """
+    Return the data version this worker's reads reflect, first catching up with writes
+    made through other workers. A catalog change reloads the snapshot and suggestions in
+    one request thread while the others keep serving the previous snapshot and version;
+    any other change just drops the read caches.
+    """
+    data_version, catalog_version = read_data_versions(db)
+    if data_version == app.state.data_version:
+        return data_version
+    if catalog_version != app.state.catalog_version:
+        if catalog_lock.acquire(blocking=False):
+            try:
+                if catalog_version != app.state.catalog_version:
+                    refresh_catalog(db)
+                    update_suggestions(db)
+            finally:
+                catalog_lock.release()
+        return app.state.data_version
+    with version_lock:
+        if data_version != app.state.data_version:
+            invalidate_read_caches()
+            app.state.data_version = data_version
+    return data_version
+
+def not_modified(request: Request, response: Response, version):
+    """
+    Attach the data-version validators to a JSON response. Returns a ready 304 when the
+    client already holds this version, otherwise None and the handler builds the body.
+    """
+    etag = version_etag(version, request.url, BUILD_ID, app.state.data_epoch)
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = API_CACHE_CONTROL
+    if is_not_modified(request, etag):
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": API_CACHE_CONTROL})
+    return None
+
+def invalidate_read_caches():
+    # Called after any write that can change what the read endpoints return
+    app.state.cache_generation += 1
+    app.state.data_changed_at = time.time()
+    app.state.results_cache.clear()
+    app.state.page_cache.clear()
+    app.state.fragment_cache.clear()
+
+def render_results_fragment(results):
+    # Same markup index.html includes for GET / and /add_college, rendered on its own so it can be cached
+    html = templates.get_template("_results.html").render(results=results, use_table=len(results) > 5)
+    return Markup(html)
+
+# Reviews are aggregated in chunks so the IN (...) list stays under SQLite's bound-parameter limit
+REVIEW_BATCH_SIZE = 500
+
+def get_review_summaries(college_ids, db: Session):
+    """
+    Return {college_id: (review_count, avg_rating, top_two_reviews)} for the given ids.
+    Counts and averages come from the precomputed review_stats table; snippets are fetched
+    only for colleges that have reviews, with one windowed query per batch.
+    """
+    ids = list(dict.fromkeys(college_ids))
+    summaries = {}
+    for start in range(0, len(ids), REVIEW_BATCH_SIZE):
+        batch = ids[start:start + REVIEW_BATCH_SIZE]
+        stats = db.query(
+            ReviewStats.college_id,
+            ReviewStats.review_count,
+            ReviewStats.avg_rating
+        ).filter(ReviewStats.college_id.in_(batch), ReviewStats.review_count > 0)
+        for college_id, review_count, avg_rating in stats:
+            summaries[college_id] = (review_count, avg_rating, [])
+
+        reviewed = [college_id for college_id in batch if college_id in summaries]
+        if not reviewed:
+            continue
+        ranked = db.query(
+            Review.college_id,
+            Review.review_text,
+            Review.rating,
+            func.row_number().over(partition_by=Review.college_id, order_by=Review.id).label("position")
+        ).filter(Review.college_id.in_(reviewed)).subquery()
+        snippets = db.query(ranked.c.college_id, ranked.c.review_text, ranked.c.rating).filter(
+            ranked.c.position <= 2
+        ).order_by(ranked.c.college_id, ranked.c.position)
+        for college_id, review_text, rating in snippets:
+            summaries[college_id][2].append({"review_text": review_text, "rating": rating})
+    return summaries
+
+def format_college_results(colleges, db: Session, sort=True):
+    summaries = get_review_summaries((college.id for college in colleges), db)
     results = []
     for college in colleges:
-        reviews = db.query(Review).filter(Review.college_name == college.name).all()
-        avg_rating = sum(r.rating for r in reviews) / len(reviews) if reviews else 0
+        review_count, avg_rating, reviews = summaries.get(college.id, (0, 0, []))
         results.append({
             "name": college.name,
             "state": college.state,
@@ -70,63 +288,83 @@ def format_college_results(colleges, db: Session):
             "max_score": college.cutoff_max,
             "fees": college.fees,
             "avg_rating": avg_rating,
-            "reviews": [{"review_text": r.review_text, "rating": r.rating} for r in reviews[:2]]
+            "review_count": review_count,
+            "reviews": reviews
         })
+    if not sort:
+        return results
     return sorted(results, key=lambda x: (-x["avg_rating"], x["fees"]))
 
 def clean_duplicates(db: Session):
     try:
-        colleges = db.query(College).all()
-        seen = set()
-        for college in colleges:
-            key = (college.name, college.state, college.location, college.course_level, getattr(college, 'branch', None))
-            if key in seen:
-                db.delete(college)
-            else:
-                seen.add(key)
+        first_ids = select(func.min(College.id)).group_by(*DEDUP_COLUMNS).scalar_subquery()
+        # Re-point reviews of duplicate rows at the surviving (lowest-id) row of their group
+        survivor = aliased(College)
+        duplicate = aliased(College)
+        survivor_id = select(func.min(survivor.id)).where(
+            duplicate.id == Review.college_id,
+            *[getattr(survivor, column.key).is_not_distinct_from(getattr(duplicate, column.key)) for column in DEDUP_COLUMNS]
+        ).scalar_subquery()
+        db.execute(
+            update(Review).where(Review.college_id.not_in(first_ids)).values(college_id=survivor_id),
+            execution_options={"synchronize_session": False}
+        )
+        # review_stats references colleges.id; the surviving rows are recomputed below
+        db.execute(
+            delete(ReviewStats).where(ReviewStats.college_id.not_in(first_ids)),
+            execution_options={"synchronize_session": False}
+        )
+        removed = db.execute(
+            delete(College).where(College.id.not_in(first_ids)),
+            execution_options={"synchronize_session": False}
+        ).rowcount
+        if removed:
+            bump_data_version(db, catalog=True)
         db.commit()
-        logger.info("✅ Removed duplicate colleges")
+        if removed:
+            rebuild_review_stats(db)
+        logger.info(f"✅ Removed {removed} duplicate colleges")
     except Exception as e:
+        db.rollback()
         logger.error(f"❌ Error cleaning duplicates: {e}")
 
 def normalize_case(db: Session):
+    # Writes keep the shadow columns in sync, so this only backfills rows from before they existed
     try:
-        colleges = db.query(College).all()
-        for college in colleges:
-            college.name = college.name.title()
-            college.state = college.state.title() if college.state else college.state
-            college.location = college.location.title() if college.location else college.location
-            if hasattr(college, 'branch') and college.branch:
-                college.branch = college.branch.title()
+        stale = db.query(College).filter(College.name_norm.is_(None), College.name.isnot(None)).all()
+        for college in stale:
+            for column, shadow in NORMALIZED_COLUMNS.items():
+                setattr(college, shadow, normalize_text(getattr(college, column)))
         db.commit()
-        logger.info("✅ Normalized case in database")
+        if stale:
+            logger.info(f"✅ Backfilled normalized columns for {len(stale)} colleges")
     except Exception as e:
+        db.rollback()
         logger.error(f"❌ Error normalizing case: {e}")
 
 def update_suggestions(db: Session):
-    colleges = db.query(College).all()
-    app.state.suggestions = {
-        "college_name": sorted([c.name for c in colleges], key=lambda x: x.lower()),
-        "location": sorted([c.location for c in colleges if c.location], key=lambda x: x.lower()),
-        "state": sorted(list(set(c.state for c in colleges if c.state)), key=lambda x: x.lower()),
-        "branch": sorted(list(set(getattr(c, 'branch', None) for c in colleges if getattr(c, 'branch', None))), key=lambda x: x.lower() if x else '')
-    }
-    logger.info(f"✅ Updated suggestions: {app.state.suggestions}")
+    # Build the replacement off to the side and swap it in with a single assignment
+    app.state.suggestions = SuggestionIndex.load(db)
+    suggestions_log.info("✅ updated", **{field: len(values) for field, values in app.state.suggestions.items()})
+    suggestions_log.payload("suggestions", app.state.suggestions.to_dict)
 
 # Create database tables and initialize data at startup
 @app.on_event("startup")
 async def startup_event():
+    to_thread.current_default_thread_limiter().total_tokens = DB_THREADS
     try:
         logger.info("Starting database setup")
         Base.metadata.create_all(bind=engine)
+        migrate_database(engine)
         logger.info("✅ Database tables created successfully")
         db = SessionLocal()
         try:
             # Verify schema
             db.execute(text("SELECT cutoff_min, cutoff_max FROM colleges LIMIT 1"))
             logger.info("✅ Schema verified: 'cutoff_min' and 'cutoff_max' columns exist")
+            # Seeding upserts on the unique_college key, so duplicates go and the key is enforced first
             clean_duplicates(db)
-            normalize_case(db)
+            ensure_unique_colleges(engine)
         except Exception as e:
             logger.error(f"❌ Schema verification or cleanup failed: {e}")
         try:
@@ -134,6 +372,25 @@ async def startup_event():
             logger.info("✅ Database initialization attempted")
         except Exception as e:
             logger.error(f"❌ Database initialization failed: {e}")
+        try:
+            app.state.data_epoch = read_data_epoch(db)
+        except Exception as e:
+            db.rollback()
+            logger.error(f"❌ Data epoch lookup failed: {e}")
+        try:
+            normalize_case(db)
+        except Exception as e:
+            logger.error(f"❌ Case normalization failed: {e}")
+        try:
+            if db.query(ReviewStats).first() is None and db.query(Review).first() is not None:
+                rebuild_review_stats(db)
+                logger.info("✅ Review statistics rebuilt")
+        except Exception as e:
+            logger.error(f"❌ Review statistics rebuild failed: {e}")
+        try:
+            refresh_catalog(db)
+        except Exception as e:
+            logger.error(f"❌ Catalog snapshot load failed: {e}")
         try:
             update_suggestions(db)
             logger.info("✅ Suggestions updated")
@@ -145,21 +402,38 @@ async def startup_event():
     except Exception as e:
         logger.error(f"❌ Error during startup: {e}")
 
+def conditional_page(request: Request, page):
+    # page is (body, etag, last_modified); revalidations that still match get an empty 304
+    body, etag, last_modified = page
+    headers = {"ETag": etag, "Last-Modified": http_date(last_modified), "Cache-Control": "no-cache"}
+    if is_not_modified(request, etag, last_modified):
+        return Response(status_code=304, headers=headers)
+    return HTMLResponse(content=body, headers=headers)
+
 @app.get("/", response_class=HTMLResponse)
-async def index(request: Request, db: Session = Depends(get_db)):
+def index(request: Request, db: Session = Depends(get_read_db)):
+    started = time.perf_counter()
+    try:
+        sync_data_version(db)
+    except Exception as e:
+        index_log.error("data version check failed", error=e)
+    generation = app.state.cache_generation
+    last_modified = app.state.data_changed_at
+    cache_key = (generation, str(request.url))
+    page = app.state.page_cache.get(cache_key)
+    if page is not None:
+        index_log.info("cache hit", started=started)
+        return conditional_page(request, page)
     try:
         query = db.query(College)
         colleges = get_deduplicated_colleges(query, db)
-        logger.info(f"GET /: Found {len(colleges)} colleges in database")
         if not colleges:
-            logger.warning("GET /: Warning: No colleges found in database!")
-        else:
-            logger.info(f"GET /: Colleges: {[c.name for c in colleges]}")
+            index_log.warning("no colleges found in database")
 
         results = format_college_results(colleges, db)
         suggestions = app.state.suggestions
         if not any(suggestions.values()):
-            logger.error("GET /: Error: Suggestions are empty! Check database data.")
+            index_log.error("suggestions are empty; check database data")
 
         states = sorted(set(c.state for c in colleges if c.state))
         locations = sorted(set(c.location for c in colleges if c.location))
@@ -176,14 +450,17 @@ async def index(request: Request, db: Session = Depends(get_db)):
         context = {
             "request": request,
             "results": results,
-            "suggestions": suggestions,
             "error": "No colleges found in database! Please contact support." if not colleges else None,
             "form_data": {},
             "seo": seo_metadata,
             "use_table": len(results) > 5
         }
-        logger.info(f"GET /: Context passed to template: {context}")
-        return templates.TemplateResponse("index.html", context)
+        index_log.info("rendering", colleges=len(colleges), started=started)
+        index_log.payload("context", lambda: context)
+        body = templates.TemplateResponse("index.html", context).body
+        page = (body, strong_etag(body), last_modified)
+        app.state.page_cache.set(cache_key, page)
+        return conditional_page(request, page)
 
     except Exception as e:
         logger.error(f"❌ GET /: Error loading data: {e}")
@@ -199,7 +476,6 @@ async def index(request: Request, db: Session = Depends(get_db)):
         context = {
             "request": request,
             "results": [],
-            "suggestions": {"college_name": [], "location": [], "state": [], "branch": []},
             "error": f"Error loading colleges: {str(e)}",
             "form_data": {},
             "seo": seo_metadata,
@@ -212,7 +488,7 @@ async def head_root():
     return Response(status_code=200)
 
 @app.post("/", response_class=HTMLResponse)
-async def index_post(
+def index_post(
     request: Request,
     course_level: str = Form(...),
     state: Optional[str] = Form(default=""),
@@ -221,9 +497,11 @@ async def index_post(
     branch: Optional[str] = Form(default=""),
     fees: Optional[str] = Form(default=""),
     score: Optional[str] = Form(default=""),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
+    started = time.perf_counter()
     try:
+        version = sync_data_version(db)
         if not course_level:
             raise HTTPException(status_code=400, detail="Course level is required.")
         allowed_course_levels = ["BTech", "Diploma", "Degree"]
@@ -240,55 +518,66 @@ async def index_post(
         college_name_lower = college_name.lower()
         if college_name_lower in {k.lower(): v for k, v in COLLEGE_MAPPINGS.items()}:
             college_name = COLLEGE_MAPPINGS[[k for k in COLLEGE_MAPPINGS if k.lower() == college_name_lower][0]]
-        logger.info(f"POST /: Inputs - course_level: {course_level}, state: {state}, location: {location}, college_name: {college_name}, branch: {branch}, fees: {fees}, score: {score}")
-
-        # Build query
-        query = db.query(College).filter(College.course_level == course_level)
-        if state:
-            query = query.filter(College.state.ilike(state))
-        if location:
-            query = query.filter(College.location.ilike(location))
-        if college_name:
-            query = query.filter(College.name.ilike(college_name))
-        if branch:
-            query = query.filter(College.branch.ilike(branch))
+        search_page_log.payload("inputs", lambda: {
+            "course_level": course_level, "state": state, "location": location,
+            "college_name": college_name, "branch": branch, "fees": fees, "score": score
+        })
+
+        fees_range = None
         if fees:
             try:
                 fees_value = float(fees)
                 lower_fee = (fees_value // 100000) * 100000
                 upper_fee = lower_fee + 100000
-                query = query.filter(College.fees.between(lower_fee, upper_fee))
+                fees_range = (lower_fee, upper_fee)
             except ValueError:
                 logger.warning(f"POST /: Invalid fees input: {fees}")
+        score_value = None
         if score:
             try:
                 score_value = float(score)
-                query = query.filter(College.cutoff_min <= score_value, College.cutoff_max >= score_value)
+                if not math.isfinite(score_value):
+                    raise ValueError(score)
             except ValueError:
+                score_value = None
                 logger.warning(f"POST /: Invalid score input: {score}")
 
-        colleges = get_deduplicated_colleges(query, db)
-        logger.info(f"POST /: Query results count: {len(colleges)}")
-
-        if not any([state, location, college_name, branch, fees, score]):
-            colleges = get_deduplicated_colleges(db.query(College).filter(College.course_level == course_level), db)
-            logger.info(f"POST /: All colleges for {course_level}: {len(colleges)}")
-
-        results = format_college_results(colleges, db)
+        # Results depend only on the normalized filters and the data they were read from
+        fragment_key = (
+            course_level, normalize_text(state), normalize_text(location), normalize_text(college_name),
+            normalize_text(branch), fees_range, score_value, version
+        )
+        fragment = app.state.fragment_cache.get(fragment_key)
+        if fragment is None:
+            colleges = search_colleges(
+                db,
+                course_level=course_level,
+                state=state,
+                location=location,
+                college_name=college_name,
+                branch=branch,
+                fees_range=fees_range,
+                score=score_value
+            )
+            results = format_college_results(colleges, db)
+            fragment = (render_results_fragment(results), len(results))
+            if app.state.data_version == version:
+                app.state.fragment_cache.set(fragment_key, fragment)
+        results_html, result_count = fragment
         suggestions = app.state.suggestions
         if not any(suggestions.values()):
-            logger.error("POST /: Error: Suggestions are empty! Check database data.")
+            search_page_log.error("suggestions are empty; check database data")
 
         error_message = None
-        if not results:
+        if not result_count:
             error_message = "No colleges found matching your criteria."
-            if state and state not in suggestions["state"]:
+            if state and not suggestions.contains("state", state):
                 error_message = f"No colleges found for state '{state}'. Available states: {', '.join(suggestions['state'][:5])}"
-            elif location and location not in suggestions["location"]:
+            elif location and not suggestions.contains("location", location):
                 error_message = f"No colleges found for location '{location}'. Available locations: {', '.join(suggestions['location'][:5])}"
-            elif college_name and college_name not in suggestions["college_name"]:
+            elif college_name and not suggestions.contains("college_name", college_name):
                 error_message = f"No colleges found for college name '{college_name}'."
-            elif branch and branch not in suggestions["branch"]:
+            elif branch and not suggestions.contains("branch", branch):
                 error_message = f"No colleges found for branch '{branch}'. Available branches: {', '.join(suggestions['branch'][:5])}"
             elif score and not score.replace(".", "").isdigit():
                 error_message = f"Score '{score}' is invalid."
@@ -305,8 +594,7 @@ async def index_post(
 
         context = {
             "request": request,
-            "results": results,
-            "suggestions": suggestions,
+            "results_html": results_html,
             "error": error_message,
             "form_data": {
                 "course_level": course_level,
@@ -317,10 +605,10 @@ async def index_post(
                 "fees": fees,
                 "score": score
             },
-            "seo": seo_metadata,
-            "use_table": len(results) > 5
+            "seo": seo_metadata
         }
-        logger.info(f"POST /: Context passed to template: {context}")
+        search_page_log.info("rendering", course_level=course_level, results=result_count, started=started)
+        search_page_log.payload("context", lambda: context)
         return templates.TemplateResponse("index.html", context)
 
     except Exception as e:
@@ -339,7 +627,6 @@ async def index_post(
             {
                 "request": request,
                 "results": [],
-                "suggestions": {"college_name": [], "location": [], "state": [], "branch": []},
                 "error": f"An error occurred while searching: {str(e)}",
                 "form_data": {
                     "course_level": course_level,
@@ -356,7 +643,8 @@ async def index_post(
         )
 
 @app.post("/api/search")
-async def search(
+def search(
+    response: Response,
     course_level: str = Form(...),
     state: Optional[str] = Form(default=""),
     location: Optional[str] = Form(default=""),
@@ -364,9 +652,14 @@ async def search(
     branch: Optional[str] = Form(default=""),
     fees: Optional[str] = Form(default=""),
     score: Optional[str] = Form(default=""),
-    db: Session = Depends(get_db)
+    limit: Optional[int] = Form(default=None),
+    cursor: Optional[str] = Form(default=None),
+    db: Session = Depends(get_read_db)
 ):
+    started = time.perf_counter()
+    after_id, limit = page_bounds(limit, cursor)
     try:
+        sync_data_version(db)
         if not course_level:
             return {"error": "Course level is required"}, 400
         allowed_course_levels = ["BTech", "Diploma", "Degree"]
@@ -384,40 +677,46 @@ async def search(
         if college_name_lower in {k.lower(): v for k, v in COLLEGE_MAPPINGS.items()}:
             college_name = COLLEGE_MAPPINGS[[k for k in COLLEGE_MAPPINGS if k.lower() == college_name_lower][0]]
 
-        query = db.query(College).filter(College.course_level == course_level)
-        if state:
-            query = query.filter(College.state.ilike(state))
-        if location:
-            query = query.filter(College.location.ilike(location))
-        if college_name:
-            query = query.filter(College.name.ilike(college_name))
-        if branch:
-            query = query.filter(College.branch.ilike(branch))
+        max_fees = None
         if fees:
             try:
                 max_fees = float(fees)
-                query = query.filter(College.fees <= max_fees)
             except ValueError:
                 logger.warning(f"POST /api/search: Invalid fees input: {fees}")
+        score_value = None
         if score:
             try:
                 score_value = float(score)
-                query = query.filter(College.cutoff_min <= score_value, College.cutoff_max >= score_value)
+                if not math.isfinite(score_value):
+                    raise ValueError(score)
             except ValueError:
+                score_value = None
                 logger.warning(f"POST /api/search: Invalid score input: {score}")
 
-        colleges = get_deduplicated_colleges(query, db)
-        results = format_college_results(colleges, db)
+        colleges = search_colleges(
+            db,
+            course_level=course_level,
+            state=state,
+            location=location,
+            college_name=college_name,
+            branch=branch,
+            max_fees=max_fees,
+            score=score_value,
+            after_id=after_id,
+            limit=limit
+        )
+        colleges = finish_page(colleges, limit, response)
+        results = format_college_results(colleges, db, sort=limit is None)
         suggestions = app.state.suggestions
-        logger.info(f"POST /api/search: Found {len(results)} colleges, {len(suggestions)} suggestions")
-        return {"results": results, "suggestions": suggestions}
+        search_api_log.info("found", results=len(results), suggestions=len(suggestions), started=started)
+        return {"results": results, "suggestions": suggestions.to_dict()}
 
     except Exception as e:
         logger.error(f"❌ POST /api/search: Error: {e}")
         return {"error": "An error occurred while searching"}, 500
 
 @app.post("/api/submit_review")
-async def submit_review(
+def submit_review(
     college_name: str = Form(...),
     review_text: str = Form(...),
     rating: str = Form(...),
@@ -435,17 +734,21 @@ async def submit_review(
             return {"error": "Invalid rating format"}, 400
 
         college_name = college_name.strip().title()
-        college = db.query(College).filter(College.name.ilike(college_name)).first()
+        college = db.query(College).filter(College.name_norm == normalize_text(college_name)).order_by(College.id).first()
         if not college:
             return {"error": "College not found"}, 404
 
         new_review = Review(
+            college_id=college.id,
             college_name=college.name,
             review_text=review_text,
             rating=rating_value
         )
         db.add(new_review)
+        record_review(db, college.id, rating_value)
+        bump_data_version(db)
         db.commit()
+        invalidate_read_caches()
         return {"message": "Review submitted successfully"}
 
     except Exception as e:
@@ -453,7 +756,7 @@ async def submit_review(
         return {"error": f"Database error: {str(e)}"}, 500
 
 @app.post("/add_college", response_class=HTMLResponse)
-async def add_college(
+def add_college(
     request: Request,
     name: str = Form(...),
     state: str = Form(...),
@@ -501,11 +804,11 @@ async def add_college(
         branch = branch.strip().title()
 
         if db.query(College).filter(
-            College.name.ilike(name),
-            College.state.ilike(state),
-            College.location.ilike(location),
-            College.course_level.ilike(course_level),
-            College.branch.ilike(branch)
+            College.name_norm == normalize_text(name),
+            College.state_norm == normalize_text(state),
+            College.location_norm == normalize_text(location),
+            College.course_level == course_level,
+            College.branch_norm == normalize_text(branch)
         ).first():
             raise HTTPException(status_code=400, detail="College with these details already exists.")
 
@@ -520,19 +823,27 @@ async def add_college(
             cutoff_max=cutoff_max
         )
         db.add(new_college)
-        db.commit()
 
         if review_text and rating:
+            db.flush()
             new_review = Review(
+                college_id=new_college.id,
                 college_name=name,
                 review_text=review_text,
                 rating=rating
             )
             db.add(new_review)
+            record_review(db, new_college.id, rating)
+        bump_data_version(db, catalog=True)
+        try:
             db.commit()
+        except IntegrityError:
+            # unique_college rejected a concurrent insert of the same college
+            db.rollback()
+            raise HTTPException(status_code=400, detail="College with these details already exists.")
 
-        update_suggestions(db)
-        suggestions = app.state.suggestions
+        app.state.suggestions.add(new_college)
+        refresh_catalog(db)
 
         seo_metadata = {
             "title": f"College Added - {name} in {state}",
@@ -549,7 +860,6 @@ async def add_college(
             {
                 "request": request,
                 "results": [],
-                "suggestions": suggestions,
                 "error": None,
                 "form_data": {},
                 "success_message": f"✅ College '{name}' added successfully!",
@@ -574,7 +884,6 @@ async def add_college(
             {
                 "request": request,
                 "results": [],
-                "suggestions": app.state.suggestions,
                 "error": f"Error adding college: {str(e)}",
                 "form_data": {},
                 "seo": seo_metadata,
@@ -582,57 +891,170 @@ async def add_college(
             }
         )
 
+# Typeahead page size bounds for /api/suggestions?field=...
+DEFAULT_SUGGESTION_LIMIT = 10
+MAX_SUGGESTION_LIMIT = 50
+
 @app.get("/api/suggestions")
-async def get_suggestions(db: Session = Depends(get_db)):
-    try:
-        return app.state.suggestions
-    except Exception as e:
-        logger.error(f"❌ GET /api/suggestions: Error: {e}")
-        return {"college_name": [], "location": [], "state": [], "branch": []}
+def get_suggestions(
+    request: Request,
+    response: Response,
+    field: Optional[str] = None,
+    prefix: str = "",
+    limit: int = DEFAULT_SUGGESTION_LIMIT,
+    db: Session = Depends(get_read_db)
+):
+    # Suggestions only change with the catalog, so reviews do not invalidate them
+    sync_data_version(db)
+    unchanged = not_modified(request, response, app.state.catalog_version)
+    if unchanged is not None:
+        return unchanged
+    if field is None:
+        try:
+            return app.state.suggestions.to_dict()
+        except Exception as e:
+            logger.error(f"❌ GET /api/suggestions: Error: {e}")
+            return {"college_name": [], "location": [], "state": [], "branch": []}
+
+    if field not in SUGGESTION_COLUMNS:
+        raise HTTPException(status_code=400, detail=f"Field must be one of {list(SUGGESTION_COLUMNS)}.")
+    if not 1 <= limit <= MAX_SUGGESTION_LIMIT:
+        raise HTTPException(status_code=400, detail=f"Limit must be between 1 and {MAX_SUGGESTION_LIMIT}.")
+    return {
+        "field": field,
+        "prefix": prefix,
+        "suggestions": app.state.suggestions.prefix(field, prefix.strip(), limit)
+    }
 
 @app.get("/health")
 async def health_check():
     return {"status": "healthy"}
 
+@app.get("/metrics/db-pool")
+async def db_pool_metrics():
+    stats = pool_stats()
+    if stats is None:
+        raise HTTPException(status_code=404, detail="Connection pool metrics are not available for this database")
+    stats["worker_threads"] = DB_THREADS
+    return stats
+
 @app.get("/api/colleges")
-async def list_colleges(db: Session = Depends(get_db)):
+def list_colleges(
+    request: Request,
+    response: Response,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_read_db)
+):
+    started = time.perf_counter()
+    after_id, limit = page_bounds(limit, cursor)
+    version = sync_data_version(db)
+    unchanged = not_modified(request, response, version)
+    if unchanged is not None:
+        return unchanged
     try:
-        colleges = get_deduplicated_colleges(db.query(College), db)
-        results = format_college_results(colleges, db)
-        logger.info(f"GET /api/colleges: Found {len(results)} colleges")
+        query = deduplicated_query(db.query(College))
+        if limit is not None:
+            query = paginate_query(query, after_id, limit)
+        colleges = finish_page(query.all(), limit, response)
+        results = format_college_results(colleges, db, sort=limit is None)
+        colleges_log.info("found", results=len(results), started=started)
         return results
     except Exception as e:
         logger.error(f"❌ GET /api/colleges: Error: {e}")
         raise HTTPException(status_code=500, detail=f"An error occurred: {str(e)}")
 
+# Rows per server-side cursor fetch, and per review-summary batch, for the NDJSON export
+STREAM_BATCH_SIZE = 500
+
+def stream_college_results():
+    """
+    Yield every deduplicated college as one JSON line, in id order, using the same
+    fields as format_college_results. Rows come off a server-side cursor and reviews
+    are summarised per batch, so memory stays flat as the catalog grows.
+    """
+    db = ReadSessionLocal()
+    try:
+        rows = deduplicated_query(db.query(College)).with_entities(
+            College.id, College.name, College.state, College.location, College.course_level,
+            College.branch, College.fees, College.cutoff_min, College.cutoff_max
+        ).execution_options(yield_per=STREAM_BATCH_SIZE)
+        batch = []
+        for row in rows:
+            college = CollegeRow(*row)
+            batch.append(college)
+            if len(batch) >= STREAM_BATCH_SIZE:
+                yield "".join(json.dumps(result) + "\n" for result in format_college_results(batch, db, sort=False))
+                batch = []
+        if batch:
+            yield "".join(json.dumps(result) + "\n" for result in format_college_results(batch, db, sort=False))
+    except Exception as e:
+        logger.error(f"❌ GET /api/colleges/stream: Error: {e}")
+        raise
+    finally:
+        db.close()
+
+@app.get("/api/colleges/stream")
+async def stream_colleges():
+    return StreamingResponse(stream_college_results(), media_type="application/x-ndjson")
+
 @app.get("/predict_colleges/")
-async def predict_colleges(score: int, db: Session = Depends(get_db)):
+def predict_colleges(
+    score: int,
+    request: Request,
+    response: Response,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_read_db)
+):
+    started = time.perf_counter()
+    after_id, limit = page_bounds(limit, cursor)
+    version = sync_data_version(db)
+    unchanged = not_modified(request, response, version)
+    if unchanged is not None:
+        return unchanged
     try:
         if score < 0:
             raise HTTPException(status_code=400, detail="Score must be non-negative")
-        query = db.query(College).filter(
-            College.cutoff_min <= score,
-            College.cutoff_max >= score
-        )
-        colleges = get_deduplicated_colleges(query, db)
-        results = format_college_results(colleges, db)
-        logger.info(f"GET /predict_colleges/?score={score}: Found {len(results)} colleges")
+        colleges = finish_page(search_colleges(db, score=score, after_id=after_id, limit=limit), limit, response)
+        results = format_college_results(colleges, db, sort=limit is None)
+        predict_log.info("found", score=score, results=len(results), started=started)
         return {"results": results}
     except Exception as e:
         logger.error(f"❌ GET /predict_colleges/: Error: {e}")
         raise HTTPException(status_code=500, detail=f"An error occurred: {str(e)}")
 
 @app.get("/api/results")
-async def get_results(score: int, db: Session = Depends(get_db)):
+def get_results(
+    score: int,
+    request: Request,
+    response: Response,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_read_db)
+):
+    started = time.perf_counter()
+    after_id, limit = page_bounds(limit, cursor)
+    version = sync_data_version(db)
+    unchanged = not_modified(request, response, version)
+    if unchanged is not None:
+        return unchanged
     try:
         if score < 0:
             raise HTTPException(status_code=400, detail="Score must be non-negative")
-        query = db.query(College).filter(
-            College.cutoff_min <= score,
-            College.cutoff_max >= score
-        )
-        colleges = get_deduplicated_colleges(query, db)
-        results = format_college_results(colleges, db)
+        catalog = app.state.catalog
+        generation = app.state.cache_generation
+        cache_key = (catalog.score_key(score), after_id, limit) if catalog is not None else None
+        cached = app.state.results_cache.get(cache_key) if cache_key else None
+        if cached is not None:
+            payload, next_cursor = cached
+            if next_cursor:
+                response.headers[NEXT_CURSOR_HEADER] = next_cursor
+            results_log.info("cache hit", score=score, results=len(payload["results"]), started=started)
+            return payload
+
+        colleges = finish_page(search_colleges(db, score=score, after_id=after_id, limit=limit), limit, response)
+        results = format_college_results(colleges, db, sort=limit is None)
         suggestions = [
             {
                 "name": c.name,
@@ -645,10 +1067,15 @@ async def get_results(score: int, db: Session = Depends(get_db)):
                 "fees": c.fees
             } for c in colleges
         ]
-        logger.info(f"GET /api/results?score={score}: Found {len(results)} colleges, {len(suggestions)} suggestions")
-        return {"results": results, "suggestions": suggestions}
+        results_log.info("found", score=score, results=len(results), suggestions=len(suggestions), started=started)
+        payload = {"results": results, "suggestions": suggestions}
+        # Skip the store if a write invalidated the cache while this response was built
+        if cache_key and app.state.cache_generation == generation:
+            app.state.results_cache.set(cache_key, (payload, response.headers.get(NEXT_CURSOR_HEADER)))
+        return payload
     except Exception as e:
         logger.error(f"❌ GET /api/results: Error: {e}")
         raise HTTPException(status_code=500, detail=f"An error occurred: {str(e)}")
-    if __name__ == "__main__":
+
+if __name__ == "__main__":
     initialize_database()
@@ -0,0 +1,86 @@
+from sqlalchemy import inspect, text
+from database import Base
+from models import College, ReviewStats, NORMALIZED_COLUMNS
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Columns a colleges table must already have to be migrated rather than recreated
+LEGACY_REQUIRED_COLUMNS = {"branch", "cutoff_min", "cutoff_max"}
+
+def _columns(connection, table):
+    return {column["name"] for column in inspect(connection).get_columns(table)}
+
+def migrate_database(engine):
+    """
+    Bring tables created by older releases up to the current models.
+    Base.metadata.create_all only creates missing tables, so columns and indexes
+    added to existing tables are applied here. Every step is safe to re-run.
+    """
+    with engine.begin() as connection:
+        tables = set(inspect(connection).get_table_names())
+        if "colleges" in tables and not LEGACY_REQUIRED_COLUMNS <= _columns(connection, "colleges"):
+            # Tables from before branches and cutoff ranges cannot be upgraded in place;
+            # startup used to drop them on every boot, so recreate them once here instead.
+            logger.warning("⚠️ Legacy colleges schema found; recreating college and review tables")
+            for table in ("review_stats", "reviews", "colleges"):
+                if table in tables:
+                    connection.execute(text(f"DROP TABLE {table}"))
+            Base.metadata.create_all(bind=connection)
+            tables = set(inspect(connection).get_table_names())
+
+        if "colleges" in tables:
+            college_columns = _columns(connection, "colleges")
+            for shadow in NORMALIZED_COLUMNS.values():
+                if shadow not in college_columns:
+                    # Filled in by normalize_case at startup
+                    connection.execute(text(f"ALTER TABLE colleges ADD COLUMN {shadow} VARCHAR"))
+                    logger.info(f"✅ Added colleges.{shadow}")
+            # Single-column indexes superseded by the composite search indexes
+            for shadow in ("state_norm", "location_norm", "branch_norm"):
+                connection.execute(text(f"DROP INDEX IF EXISTS ix_colleges_{shadow}"))
+            for index in College.__table__.indexes:
+                index.create(connection, checkfirst=True)
+
+        if "reviews" in tables:
+            review_columns = _columns(connection, "reviews")
+            if "created_at" not in review_columns:
+                connection.execute(text("ALTER TABLE reviews ADD COLUMN created_at TIMESTAMP"))
+                logger.info("✅ Added reviews.created_at")
+            if "college_id" not in review_columns:
+                connection.execute(text("ALTER TABLE reviews ADD COLUMN college_id INTEGER REFERENCES colleges(id)"))
+                logger.info("✅ Added reviews.college_id")
+            connection.execute(text("CREATE INDEX IF NOT EXISTS ix_reviews_college_id ON reviews (college_id)"))
+            # Attach legacy name-keyed reviews to the first college row with that name
+            backfilled = connection.execute(text(
+                "UPDATE reviews SET college_id = ("
+                " SELECT MIN(colleges.id) FROM colleges WHERE lower(colleges.name) = lower(reviews.college_name)"
+                ") WHERE college_id IS NULL AND EXISTS ("
+                " SELECT 1 FROM colleges WHERE lower(colleges.name) = lower(reviews.college_name))"
+            ))
+            if backfilled.rowcount:
+                logger.info(f"✅ Linked {backfilled.rowcount} reviews to college ids")
+
+        if "review_stats" in tables and "college_id" not in _columns(connection, "review_stats"):
+            # The summary is derived data; drop the name-keyed table and let startup rebuild it
+            ReviewStats.__table__.drop(connection)
+            ReviewStats.__table__.create(connection)
+            logger.info("✅ Recreated review_stats keyed by college id")
+
+def ensure_unique_colleges(engine):
+    """
+    Make sure the unique_college key is enforced by the database, so duplicate colleges
+    cannot be written. Tables created from the models already carry the constraint; older
+    ones get an equivalent unique index. Must run after clean_duplicates.
+    """
+    columns = ["name", "state", "location", "course_level", "branch"]
+    with engine.begin() as connection:
+        inspector = inspect(connection)
+        if "colleges" not in inspector.get_table_names():
+            return
+        unique_keys = [constraint["column_names"] for constraint in inspector.get_unique_constraints("colleges")]
+        unique_keys += [index["column_names"] for index in inspector.get_indexes("colleges") if index.get("unique")]
+        if columns in unique_keys:
+            return
+        connection.execute(text(f"CREATE UNIQUE INDEX IF NOT EXISTS unique_college ON colleges ({', '.join(columns)})"))
+        logger.info("✅ Added unique_college index")
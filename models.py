@@ -1,7 +1,17 @@
-from sqlalchemy import Column, Integer, String, Float, UniqueConstraint
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Index, UniqueConstraint, event
 from database import Base
+from datetime import datetime
 
+# Display column -> case-folded, whitespace-collapsed shadow column used for lookups
+NORMALIZED_COLUMNS = {
+    "name": "name_norm",
+    "state": "state_norm",
+    "location": "location_norm",
+    "branch": "branch_norm",
+}
 
+def normalize_text(value):
+    return " ".join(value.split()).casefold() if value else None
 
 class College(Base):
     __tablename__ = "colleges"
@@ -14,14 +24,50 @@ class College(Base):
     fees = Column(Float)
     cutoff_min = Column(Float)
     cutoff_max = Column(Float)
+    name_norm = Column(String, index=True)
+    state_norm = Column(String)
+    location_norm = Column(String)
+    branch_norm = Column(String)
 
     # Add unique constraint
     __table_args__ = (
         UniqueConstraint('name', 'state', 'location', 'course_level', 'branch', name='unique_college'),
+        # Search filters always pin course_level; each index leads with it and then the most
+        # selective optional filter (see build_search_query and query_plans.py)
+        Index('ix_colleges_level_state', 'course_level', 'state_norm', 'location_norm', 'branch_norm', 'fees'),
+        Index('ix_colleges_level_location', 'course_level', 'location_norm', 'branch_norm', 'fees'),
+        Index('ix_colleges_level_name', 'course_level', 'name_norm', 'branch_norm'),
+        Index('ix_colleges_level_branch', 'course_level', 'branch_norm', 'fees'),
+        Index('ix_colleges_level_fees', 'course_level', 'fees'),
+        Index('ix_colleges_level_cutoff', 'course_level', 'cutoff_min', 'cutoff_max'),
+        # Score-only lookups from /api/results and /predict_colleges/
+        Index('ix_colleges_cutoff', 'cutoff_min', 'cutoff_max'),
     )
+
+@event.listens_for(College, "before_insert")
+@event.listens_for(College, "before_update")
+def sync_normalized_columns(mapper, connection, college):
+    for column, shadow in NORMALIZED_COLUMNS.items():
+        setattr(college, shadow, normalize_text(getattr(college, column)))
+
 class Review(Base):
     __tablename__ = "reviews"
     id = Column(Integer, primary_key=True)
+    college_id = Column(Integer, ForeignKey("colleges.id"), index=True)
     college_name = Column(String, nullable=False)
     review_text = Column(String)
     rating = Column(Float)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+class ReviewStats(Base):
+    __tablename__ = "review_stats"
+    college_id = Column(Integer, ForeignKey("colleges.id"), primary_key=True)
+    review_count = Column(Integer, nullable=False, default=0)
+    rating_sum = Column(Float, nullable=False, default=0)
+    avg_rating = Column(Float, nullable=False, default=0)
+    last_review_at = Column(DateTime)
+
+class AppMetadata(Base):
+    __tablename__ = "app_metadata"
+    key = Column(String, primary_key=True)
+    value = Column(String)
@@ -0,0 +1,53 @@
+from fastapi import HTTPException
+from models import College
+import base64
+import binascii
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+def encode_cursor(last_id):
+    return base64.urlsafe_b64encode(f"id:{last_id}".encode()).decode().rstrip("=")
+
+def decode_cursor(cursor):
+    try:
+        decoded = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        prefix, _, last_id = decoded.partition(":")
+        if prefix != "id":
+            raise ValueError(cursor)
+        return int(last_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor.")
+
+def page_bounds(limit, cursor):
+    """
+    Validate the limit/cursor pair sent by a client.
+    Returns (after_id, limit), or (None, None) when the client did not ask for paging.
+    """
+    if limit is None and not cursor:
+        return None, None
+    if limit is None:
+        limit = DEFAULT_PAGE_SIZE
+    if not 1 <= limit <= MAX_PAGE_SIZE:
+        raise HTTPException(status_code=400, detail=f"Limit must be between 1 and {MAX_PAGE_SIZE}.")
+    return (decode_cursor(cursor) if cursor else None), limit
+
+def paginate_query(query, after_id, limit):
+    # Keyset paging on the primary key; one extra row tells us whether another page exists
+    if after_id is not None:
+        query = query.filter(College.id > after_id)
+    query = query.order_by(College.id)
+    if limit is not None:
+        query = query.limit(limit + 1)
+    return query
+
+def finish_page(rows, limit, response):
+    """
+    Drop the look-ahead row and advertise the next page through the X-Next-Cursor header.
+    """
+    if limit is None or len(rows) <= limit:
+        return rows
+    rows = rows[:limit]
+    response.headers[NEXT_CURSOR_HEADER] = encode_cursor(rows[-1].id)
+    return rows
@@ -0,0 +1,91 @@
+from collections import deque
+from threading import Lock
+import time
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+class PoolMetrics:
+    """
+    Thread-safe counters for connection checkouts: how long callers waited for a
+    connection (including pre-ping and new connections) and how often the pool ran dry.
+    """
+
+    def __init__(self, window=1024):
+        self._lock = Lock()
+        self._recent = deque(maxlen=window)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.max_in_use = 0
+
+    def record(self, wait, in_use):
+        with self._lock:
+            self.checkouts += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+            self.max_in_use = max(self.max_in_use, in_use)
+            self._recent.append(wait)
+
+    def record_timeout(self):
+        with self._lock:
+            self.timeouts += 1
+
+    def snapshot(self):
+        with self._lock:
+            recent = sorted(self._recent)
+            checkouts, timeouts = self.checkouts, self.timeouts
+            total_wait, max_wait, max_in_use = self.total_wait, self.max_wait, self.max_in_use
+
+        def percentile(fraction):
+            return recent[min(len(recent) - 1, int(len(recent) * fraction))] * 1000 if recent else 0.0
+
+        return {
+            "checkouts": checkouts,
+            "timeouts": timeouts,
+            "max_in_use": max_in_use,
+            "wait_ms": {
+                "mean": total_wait / checkouts * 1000 if checkouts else 0.0,
+                "p50": percentile(0.5),
+                "p95": percentile(0.95),
+                "max": max_wait * 1000,
+            },
+        }
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that times every checkout and tracks how close the pool is to its limit."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except PoolTimeoutError:
+            self.metrics.record_timeout()
+            raise
+        self.metrics.record(time.perf_counter() - started, self.checkedout())
+        return connection
+
+    def recreate(self):
+        # engine.dispose() swaps in a fresh pool; keep the counters
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+    def stats(self):
+        capacity = self.size() + max(self._max_overflow, 0)
+        in_use = self.checkedout()
+        stats = {
+            "size": self.size(),
+            "max_overflow": self._max_overflow,
+            "timeout": self.timeout(),
+            "checked_out": in_use,
+            "checked_in": self.checkedin(),
+            "overflow": self.overflow(),
+            "saturation": in_use / capacity if capacity else 0.0,
+        }
+        stats.update(self.metrics.snapshot())
+        return stats
@@ -0,0 +1,67 @@
+"""
+Query-plan regression check for the search filters.
+
+Builds every filter combination that build_search_query accepts, runs EXPLAIN QUERY PLAN
+on the deduplicated statement against a fresh SQLite schema and fails when any step
+scans the colleges table instead of searching one of its indexes.
+
+    python query_plans.py
+"""
+from itertools import product
+import logging
+import sys
+
+from sqlalchemy import create_engine
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.orm import sessionmaker
+
+from database import Base
+from main import build_search_query, deduplicated_query
+
+TEXT_FILTERS = ("state", "location", "college_name", "branch")
+FEE_FILTERS = ({}, {"fees_range": (50000.0, 150000.0)}, {"max_fees": 100000.0})
+
+def filter_combinations():
+    # Score-only and unfiltered listings are answered from the catalog snapshot and
+    # read the whole table by design, so every checked combination pins course_level
+    for enabled in product((False, True), repeat=len(TEXT_FILTERS)):
+        for fees in FEE_FILTERS:
+            for score in (None, 5000.0):
+                filters = {"course_level": "BTech"}
+                filters.update({field: "Sample" for field, on in zip(TEXT_FILTERS, enabled) if on})
+                filters.update(fees)
+                if score is not None:
+                    filters["score"] = score
+                yield filters
+
+def explain(db, query):
+    statement = query.statement.compile(dialect=sqlite.dialect(), compile_kwargs={"literal_binds": True})
+    rows = db.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}")
+    return [row[3] for row in rows]
+
+def check_query_plans():
+    """Return (filters, plan) for every combination whose plan contains a table scan."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    failures = []
+    try:
+        for filters in filter_combinations():
+            plan = explain(db, deduplicated_query(build_search_query(db, **filters)))
+            if any(step.startswith("SCAN") for step in plan):
+                failures.append((filters, plan))
+    finally:
+        db.close()
+        engine.dispose()
+    return failures
+
+if __name__ == "__main__":
+    logging.disable(logging.INFO)
+    failures = check_query_plans()
+    for filters, plan in failures:
+        print(f"❌ {filters}")
+        for step in plan:
+            print(f"    {step}")
+    if failures:
+        sys.exit(1)
+    print("✅ Every search filter combination uses an index")
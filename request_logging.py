@@ -0,0 +1,73 @@
+import logging
+import os
+import random
+import time
+
+# Fraction of info events logged per route, e.g. LOG_SAMPLE_RATES="GET /=0.1,GET /api/results=0.05".
+# Routes not listed use LOG_SAMPLE_RATE. Warnings and errors are never sampled.
+LOG_SAMPLE_RATE = float(os.getenv("LOG_SAMPLE_RATE", "1.0"))
+# Full payload dumps (template contexts, suggestion lists) are only emitted with LOG_PAYLOADS=true
+LOG_PAYLOADS = os.getenv("LOG_PAYLOADS", "false").lower() in ("1", "true", "yes")
+
+def _parse_sample_rates(spec):
+    rates = {}
+    for entry in spec.split(","):
+        route, _, rate = entry.rpartition("=")
+        if route.strip():
+            rates[route.strip()] = float(rate)
+    return rates
+
+LOG_SAMPLE_RATES = _parse_sample_rates(os.getenv("LOG_SAMPLE_RATES", ""))
+
+class StructuredMessage:
+    """Log record message rendered as `route event key=value ...` only when a handler emits it."""
+
+    __slots__ = ("route", "event", "fields")
+
+    def __init__(self, route, event, fields):
+        self.route = route
+        self.event = event
+        self.fields = fields
+
+    def __str__(self):
+        fields = " ".join(f"{key}={_render(value)}" for key, value in self.fields.items())
+        return f"{self.route} {self.event} {fields}".rstrip()
+
+def _render(value):
+    if callable(value):
+        value = value()
+    if isinstance(value, float):
+        return f"{value:.2f}"
+    return value
+
+class RouteLogger:
+    """
+    Per-route wrapper around a module logger. info() takes counts and timings as keyword
+    fields; values may be callables so expensive ones are only computed when logged.
+    """
+
+    def __init__(self, logger, route):
+        self.logger = logger
+        self.route = route
+        self.sample_rate = LOG_SAMPLE_RATES.get(route, LOG_SAMPLE_RATE)
+
+    def _sampled(self):
+        return self.sample_rate >= 1 or random.random() < self.sample_rate
+
+    def info(self, event, started=None, **fields):
+        if not self.logger.isEnabledFor(logging.INFO) or not self._sampled():
+            return
+        if started is not None:
+            fields["elapsed_ms"] = (time.perf_counter() - started) * 1000
+        self.logger.info(StructuredMessage(self.route, event, fields))
+
+    def warning(self, event, **fields):
+        self.logger.warning(StructuredMessage(self.route, event, fields))
+
+    def error(self, event, **fields):
+        self.logger.error(StructuredMessage(self.route, event, fields))
+
+    def payload(self, name, value):
+        # value is usually a callable returning the payload, so nothing is built unless dumped
+        if LOG_PAYLOADS and self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(StructuredMessage(self.route, "payload", {name: value}))
@@ -0,0 +1,80 @@
+from database import SessionLocal
+from models import Review, ReviewStats
+from sqlalchemy import func, insert, update
+from sqlalchemy.dialects import postgresql, sqlite
+from datetime import datetime
+
+def _upsert_statement(dialect_name, values):
+    # Single statement, so concurrent first reviews of a college cannot both insert
+    if dialect_name == "sqlite":
+        statement = sqlite.insert(ReviewStats).values(**values)
+    elif dialect_name == "postgresql":
+        statement = postgresql.insert(ReviewStats).values(**values)
+    else:
+        return None
+    return statement.on_conflict_do_update(
+        index_elements=["college_id"],
+        set_={
+            "review_count": ReviewStats.review_count + 1,
+            "rating_sum": ReviewStats.rating_sum + values["rating_sum"],
+            "avg_rating": (ReviewStats.rating_sum + values["rating_sum"]) / (ReviewStats.review_count + 1),
+            "last_review_at": values["last_review_at"]
+        }
+    )
+
+def record_review(db, college_id, rating, reviewed_at=None):
+    """
+    Fold one new review into the college's summary row.
+    Runs inside the caller's transaction; the caller commits.
+    """
+    reviewed_at = reviewed_at or datetime.utcnow()
+    values = {
+        "college_id": college_id,
+        "review_count": 1,
+        "rating_sum": rating,
+        "avg_rating": rating,
+        "last_review_at": reviewed_at
+    }
+    upsert = _upsert_statement(db.get_bind().dialect.name, values)
+    if upsert is not None:
+        db.execute(upsert)
+        return
+    updated = db.execute(
+        update(ReviewStats)
+        .where(ReviewStats.college_id == college_id)
+        .values(
+            review_count=ReviewStats.review_count + 1,
+            rating_sum=ReviewStats.rating_sum + rating,
+            avg_rating=(ReviewStats.rating_sum + rating) / (ReviewStats.review_count + 1),
+            last_review_at=reviewed_at
+        )
+    )
+    if updated.rowcount == 0:
+        db.add(ReviewStats(**values))
+
+def rebuild_review_stats(db):
+    """
+    Recompute every summary row from the reviews table in one bulk pass.
+    """
+    db.query(ReviewStats).delete(synchronize_session=False)
+    db.execute(
+        insert(ReviewStats).from_select(
+            ["college_id", "review_count", "rating_sum", "avg_rating", "last_review_at"],
+            db.query(
+                Review.college_id,
+                func.count(Review.id),
+                func.coalesce(func.sum(Review.rating), 0),
+                func.coalesce(func.avg(Review.rating), 0),
+                func.max(Review.created_at)
+            ).filter(Review.college_id.isnot(None)).group_by(Review.college_id)
+        )
+    )
+    db.commit()
+
+if __name__ == "__main__":
+    db = SessionLocal()
+    try:
+        rebuild_review_stats(db)
+        print(f"✅ Rebuilt review statistics for {db.query(ReviewStats).count()} colleges")
+    finally:
+        db.close()
@@ -0,0 +1,98 @@
+// static/index.js: score results and search-field typeahead for templates/index.html
+async function fetchAndDisplayResults(score) {
+    try {
+        const url = `/api/results?score=${score}`;
+        const response = await fetch(url);
+        if (!response.ok) {
+            throw new Error(`HTTP error! status: ${response.status}`);
+        }
+        const data = await response.json();
+
+        // Populate Results
+        const tableBody = document.querySelector("#results-table tbody");
+        tableBody.innerHTML = ""; // Clear old
+        if (data.results.length === 0) {
+            tableBody.innerHTML = '<tr><td colspan="9" class="text-center py-4 text-gray-500">No colleges found for this score.</td></tr>';
+        } else {
+            data.results.forEach(college => {
+                const reviewText = college.reviews.length > 0 ? college.reviews[0].review_text : "No review";
+                const row = `
+                    <tr>
+                        <td>${college.name}</td>
+                        <td>${college.state}</td>
+                        <td>${college.location}</td>
+                        <td>${college.course_level}</td>
+                        <td>${college.branch}</td>
+                        <td>${college.min_score} – ${college.max_score}</td>
+                        <td>₹${college.fees}</td>
+                        <td class="rating">${college.avg_rating.toFixed(1)}</td>
+                        <td>${reviewText}</td>
+                    </tr>
+                `;
+                tableBody.innerHTML += row;
+            });
+        }
+
+        // Populate Suggestions
+        const suggestionList = document.getElementById("suggestions-list");
+        suggestionList.innerHTML = "";
+        if (data.suggestions.length === 0) {
+            suggestionList.innerHTML = '<p class="text-center text-gray-500">No suggestions available.</p>';
+        } else {
+            data.suggestions.forEach(suggestion => {
+                const card = `
+                    <div class="suggestion-card">
+                        <strong class="text-lg text-gray-800">${suggestion.name}</strong><br>
+                        <span class="text-gray-600">${suggestion.branch} - ${suggestion.location}, ${suggestion.state}</span><br>
+                        <span class="text-gray-500">Fees: ₹${suggestion.fees}</span>
+                    </div>
+                `;
+                suggestionList.innerHTML += card;
+            });
+        }
+    } catch (error) {
+        console.error('Error fetching results:', error);
+        const tableBody = document.querySelector("#results-table tbody");
+        tableBody.innerHTML = '<tr><td colspan="9" class="text-center py-4 text-red-500">Error loading results. Please try again.</td></tr>';
+        const suggestionList = document.getElementById("suggestions-list");
+        suggestionList.innerHTML = '<p class="text-center text-red-500">Error loading suggestions.</p>';
+    }
+}
+
+// Typeahead: fill each datalist with a few prefix matches instead of the full vocabulary
+function attachSuggestions(input) {
+    const datalist = document.getElementById(input.getAttribute("list"));
+    let timer = null;
+    input.addEventListener("input", () => {
+        clearTimeout(timer);
+        timer = setTimeout(async () => {
+            const prefix = input.value.trim();
+            if (!prefix) {
+                datalist.innerHTML = "";
+                return;
+            }
+            try {
+                const params = new URLSearchParams({ field: input.dataset.suggest, prefix: prefix, limit: 10 });
+                const response = await fetch(`/api/suggestions?${params}`);
+                if (!response.ok) {
+                    return;
+                }
+                const data = await response.json();
+                datalist.innerHTML = "";
+                data.suggestions.forEach(value => {
+                    const option = document.createElement("option");
+                    option.value = value;
+                    datalist.appendChild(option);
+                });
+            } catch (error) {
+                console.error('Error fetching suggestions:', error);
+            }
+        }, 150);
+    });
+}
+document.querySelectorAll("input[data-suggest]").forEach(attachSuggestions);
+
+// Run on page load with default score
+window.onload = () => {
+    fetchAndDisplayResults(600);
+};
@@ -0,0 +1,100 @@
+from bisect import bisect_left
+from threading import Lock
+from models import College
+
+# Suggestion field -> College column it is drawn from
+SUGGESTION_COLUMNS = {
+    "college_name": College.name,
+    "location": College.location,
+    "state": College.state,
+    "branch": College.branch,
+}
+
+def _sort_key(value):
+    # Case-insensitive order, with the original spelling as a tie-breaker so the order is total
+    return (value.lower(), value)
+
+class SuggestionIndex:
+    """
+    Deduplicated, case-insensitively sorted suggestion lists per field.
+    Reads behave like the old {field: [values]} dict. add() places a new value with a
+    binary search into copies of the lists and publishes them with a single assignment,
+    so concurrent readers always see matching keys and values.
+    """
+
+    def __init__(self, values_by_field=None):
+        # field -> (sort keys, values); replaced whole, never mutated in place
+        self._fields = {}
+        self._lock = Lock()
+        for field in SUGGESTION_COLUMNS:
+            values = sorted({value for value in (values_by_field or {}).get(field, ()) if value}, key=_sort_key)
+            self._fields[field] = ([_sort_key(value) for value in values], values)
+
+    @classmethod
+    def load(cls, db):
+        return cls({
+            field: [value for (value,) in db.query(column).distinct()]
+            for field, column in SUGGESTION_COLUMNS.items()
+        })
+
+    def add(self, college):
+        with self._lock:
+            fields = dict(self._fields)
+            for field, column in SUGGESTION_COLUMNS.items():
+                value = getattr(college, column.key, None)
+                if not value:
+                    continue
+                key = _sort_key(value)
+                keys, values = fields[field]
+                position = bisect_left(keys, key)
+                if position < len(keys) and keys[position] == key:
+                    continue
+                fields[field] = (
+                    keys[:position] + [key] + keys[position:],
+                    values[:position] + [value] + values[position:],
+                )
+            self._fields = fields
+
+    def contains(self, field, value):
+        keys, _ = self._fields[field]
+        key = _sort_key(value)
+        position = bisect_left(keys, key)
+        return position < len(keys) and keys[position] == key
+
+    def prefix(self, field, prefix, limit=10):
+        """
+        Return up to limit values of field starting with prefix, case-insensitively, in
+        sorted order. One bisect finds the first candidate; the matches are contiguous.
+        """
+        keys, values = self._fields[field]
+        prefix = prefix.lower()
+        matches = []
+        position = bisect_left(keys, (prefix,))
+        while position < len(keys) and len(matches) < limit and keys[position][0].startswith(prefix):
+            matches.append(values[position])
+            position += 1
+        return matches
+
+    def _values(self):
+        return {field: values for field, (_, values) in self._fields.items()}
+
+    def __getitem__(self, field):
+        return self._fields[field][1]
+
+    def __len__(self):
+        return len(self._fields)
+
+    def keys(self):
+        return self._fields.keys()
+
+    def values(self):
+        return self._values().values()
+
+    def items(self):
+        return self._values().items()
+
+    def to_dict(self):
+        return {field: list(values) for field, values in self._values().items()}
+
+    def __repr__(self):
+        return repr(self._values())